@@ -2,7 +2,7 @@
 RLM Chunking Strategy
 Provides intelligent chunking with semantic boundaries and overlap
 """
-from typing import List, Tuple
+from typing import Iterable, Iterator, List, Optional, Tuple
 import re
 from rlm_state import ChunkPlan
 
@@ -59,6 +59,72 @@ class ChunkingStrategy:
 
         return chunks
 
+    def chunk_iter(
+        self,
+        lines: Iterable[str],
+        by_paragraph: bool = False,
+        show_warning_callback=None
+    ) -> Iterator[Tuple[int, int, str]]:
+        """
+        Chunk a stream of lines without joining them into one string first.
+
+        Yields the same chunks as chunk_by_paragraph / chunk_text would
+        return for '\n'.join(lines).
+
+        Args:
+            lines: Lines of text, without trailing newlines
+            by_paragraph: Use paragraph chunking instead of character chunking
+            show_warning_callback: Optional callback for paragraph warnings
+
+        Yields:
+            (start, end, chunk_text) tuples
+        """
+        if by_paragraph:
+            return self._chunk_paragraphs(self._iter_paragraphs(lines), show_warning_callback)
+        return self._chunk_lines(lines)
+
+    def _chunk_lines(self, lines: Iterable[str]) -> Iterator[Tuple[int, int, str]]:
+        """Lazy chunk_text: only about two chunks of text are buffered at a time"""
+        # Keep enough text that a full step (up to max(overlap, chunk_size))
+        # still leaves a chunk_size window, so break-point lookahead sees the
+        # same characters it would in the full text
+        window = max(self.chunk_size, self.overlap) + self.chunk_size + 2
+        buffer = ""
+        base = 0  # offset of buffer[0] in the joined text
+        first = True
+
+        for line in lines:
+            buffer = buffer + line if first else buffer + "\n" + line
+            first = False
+
+            # _find_sentence_boundary skips runs of quotes/parens/spaces past
+            # the window, so also wait until such a trailing run has ended
+            while (len(buffer) >= window
+                   and len(buffer.rstrip('"\' )')) > self.chunk_size + 1):
+                end = self._find_break_point(buffer, 0, self.chunk_size)
+                chunk_text = buffer[:end].strip()
+                if chunk_text:
+                    yield (base, base + end, chunk_text)
+                step = max(self.overlap, end)
+                buffer = buffer[step:]
+                base += step
+
+        for start, end, chunk_text in self.chunk_text(buffer):
+            yield (base + start, base + end, chunk_text)
+
+    @staticmethod
+    def _iter_paragraphs(lines: Iterable[str]) -> Iterator[str]:
+        """Group lines into paragraphs split by blank (whitespace-only) lines"""
+        paragraph: List[str] = []
+        for line in lines:
+            if line.strip():
+                paragraph.append(line)
+            elif paragraph:
+                yield '\n'.join(paragraph)
+                paragraph = []
+        if paragraph:
+            yield '\n'.join(paragraph)
+
     def chunk_by_paragraph(self, text: str, show_warning_callback=None) -> List[Tuple[int, int, str]]:
         """
         Chunk text by paragraph boundaries.
@@ -77,8 +143,14 @@ class ChunkingStrategy:
 
         # Split by double newlines (paragraphs)
         paragraphs = re.split(r'\n\s*\n', text)
-        
-        chunks = []
+        return list(self._chunk_paragraphs(paragraphs, show_warning_callback))
+
+    def _chunk_paragraphs(
+        self,
+        paragraphs: Iterable[str],
+        show_warning_callback=None
+    ) -> Iterator[Tuple[int, int, str]]:
+        """Pack paragraphs into chunks; shared by chunk_by_paragraph and chunk_iter"""
         current_chunk = []
         current_size = 0
         current_start = 0
@@ -95,7 +167,7 @@ class ChunkingStrategy:
                 # Save current chunk first
                 if current_chunk:
                     chunk_text = '\n\n'.join(current_chunk)
-                    chunks.append((current_start, current_start + len(chunk_text), chunk_text))
+                    yield (current_start, current_start + len(chunk_text), chunk_text)
                     current_chunk = []
                     current_size = 0
                 
@@ -106,7 +178,7 @@ class ChunkingStrategy:
                 # Split large paragraph by sentences
                 sentence_chunks = self._split_paragraph_by_sentences(para)
                 for sent_chunk in sentence_chunks:
-                    chunks.append((0, len(sent_chunk), sent_chunk))
+                    yield (0, len(sent_chunk), sent_chunk)
                 
                 current_start = 0
                 continue
@@ -116,7 +188,7 @@ class ChunkingStrategy:
                 # Save current chunk
                 if current_chunk:
                     chunk_text = '\n\n'.join(current_chunk)
-                    chunks.append((current_start, current_start + len(chunk_text), chunk_text))
+                    yield (current_start, current_start + len(chunk_text), chunk_text)
                 
                 # Start new chunk with this paragraph
                 current_chunk = [para]
@@ -130,9 +202,7 @@ class ChunkingStrategy:
         # Save final chunk
         if current_chunk:
             chunk_text = '\n\n'.join(current_chunk)
-            chunks.append((current_start, current_start + len(chunk_text), chunk_text))
-        
-        return chunks
+            yield (current_start, current_start + len(chunk_text), chunk_text)
     
     def _split_paragraph_by_sentences(self, paragraph: str) -> List[str]:
         """
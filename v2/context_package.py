@@ -2,15 +2,56 @@
 RLM Context Package Builder
 Creates structured context package for sub-translator
 """
-from typing import Dict, Any, List
+from typing import Dict, Any, Iterable, List, Optional, Set
 from rlm_state import TranslationState, PresetType
 
+try:
+    import ahocorasick  # optional, pyahocorasick
+except ImportError:
+    ahocorasick = None
+
+
+class GlossaryMatcher:
+    """
+    Finds which glossary source terms occur in a text (case-insensitive).
+    Build once per glossary and reuse for every chunk; with pyahocorasick
+    installed a lookup is one pass over the text regardless of term count.
+    """
+
+    def __init__(self, terms: Iterable[str]):
+        # lowercased term -> original spellings
+        self._by_lower: Dict[str, Set[str]] = {}
+        for term in terms:
+            if term:
+                self._by_lower.setdefault(term.lower(), set()).add(term)
+        self.terms = frozenset(t for group in self._by_lower.values() for t in group)
+
+        self._automaton = None
+        if ahocorasick is not None and self._by_lower:
+            self._automaton = ahocorasick.Automaton()
+            for lowered in self._by_lower:
+                self._automaton.add_word(lowered, lowered)
+            self._automaton.make_automaton()
+
+    def find(self, text: str) -> Set[str]:
+        """Return the terms that occur in text"""
+        return self.find_lowered(text.lower())
+
+    def find_lowered(self, lowered_text: str) -> Set[str]:
+        """find() for text the caller has already lowercased"""
+        if self._automaton is not None:
+            hits = {lowered for _, lowered in self._automaton.iter(lowered_text)}
+        else:
+            hits = {lowered for lowered in self._by_lower if lowered in lowered_text}
+        return {term for lowered in hits for term in self._by_lower[lowered]}
+
 
 def build_context_package(
     state: TranslationState,
     current_chunk_text: str,
     current_chunk_index: int,
-    hard_glossary: Dict[str, str] = None
+    hard_glossary: Dict[str, str] = None,
+    glossary_matcher: Optional[GlossaryMatcher] = None
 ) -> Dict[str, Any]:
     """
     Build context package for sub-translator.
@@ -20,6 +61,8 @@ def build_context_package(
         current_chunk_text: Text of current chunk to translate
         current_chunk_index: Index of current chunk
         hard_glossary: Additional hard glossary entries (optional)
+        glossary_matcher: Matcher over the user glossary (optional); its
+            terms that do not occur in the chunk are left out of the package
 
     Returns:
         Dict with structured context
@@ -31,6 +74,15 @@ def build_context_package(
     if hard_glossary:
         package["hard_glossary"].update(hard_glossary)
 
+    # Only send user glossary terms this chunk actually contains
+    if glossary_matcher is not None:
+        absent = glossary_matcher.terms - glossary_matcher.find(current_chunk_text)
+        if absent:
+            for key in ("hard_glossary", "confirmed_terms"):
+                terms = package[key]
+                for term in absent & terms.keys():
+                    del terms[term]
+
     # Build local context (last 3-5 chunks)
     local_context = _build_local_context(state)
 
@@ -4,13 +4,22 @@ Multi-provider support: LM Studio, OpenAI, Google Gemini
 """
 import os
 import json
+import hashlib
+import threading
 import requests
+from collections import OrderedDict
+from pathlib import Path
 from typing import Optional, List, Dict, Any
 from dataclasses import dataclass, field
 from abc import ABC, abstractmethod
 
 from config import LLMConfig
 
+try:
+    import diskcache  # optional, persists the response cache across sessions
+except ImportError:
+    diskcache = None
+
 
 @dataclass
 class LLMResponse:
@@ -32,18 +41,22 @@ class CostTracker:
     sub_input_tokens: int = 0
     sub_output_tokens: int = 0
     total_cost: float = 0.0
+    # Sub calls may complete concurrently (RLMTranslatorV2.max_concurrency)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
     
     def add_root_call(self, input_tokens: int, output_tokens: int, cost: float = 0.0):
-        self.root_calls += 1
-        self.root_input_tokens += input_tokens
-        self.root_output_tokens += output_tokens
-        self.total_cost += cost
+        with self._lock:
+            self.root_calls += 1
+            self.root_input_tokens += input_tokens
+            self.root_output_tokens += output_tokens
+            self.total_cost += cost
         
     def add_sub_call(self, input_tokens: int, output_tokens: int, cost: float = 0.0):
-        self.sub_calls += 1
-        self.sub_input_tokens += input_tokens
-        self.sub_output_tokens += output_tokens
-        self.total_cost += cost
+        with self._lock:
+            self.sub_calls += 1
+            self.sub_input_tokens += input_tokens
+            self.sub_output_tokens += output_tokens
+            self.total_cost += cost
     
     def summary(self) -> Dict[str, Any]:
         return {
@@ -349,6 +362,75 @@ class GeminiProvider(LLMProvider):
             return False
 
 
+class ResponseCache:
+    """
+    Completion results keyed by a hash of everything sent to the provider.
+    Stored on disk with diskcache when installed, otherwise kept in memory
+    for the current session only. Both are bounded, and empty or truncated
+    responses are never stored, so retries get a fresh answer.
+    """
+    
+    DEFAULT_DIR = Path.home() / ".rlm_trans_cache"
+    DISK_SIZE_LIMIT = 256 * 1024 * 1024  # bytes, diskcache culls beyond this
+    MEMORY_MAX_ENTRIES = 2048  # least recently used entries are dropped
+    
+    def __init__(self, directory: Optional[Path] = None):
+        self._lock = threading.Lock()
+        if diskcache is not None:
+            self._disk = diskcache.Cache(
+                str(directory or self.DEFAULT_DIR), size_limit=self.DISK_SIZE_LIMIT
+            )
+            self._memory = None
+        else:
+            self._disk = None
+            self._memory: "OrderedDict[str, str]" = OrderedDict()
+    
+    @staticmethod
+    def make_key(provider: str, model: str, messages: List[Dict], **kwargs) -> str:
+        payload = json.dumps(
+            [provider, model, messages, kwargs], ensure_ascii=False, sort_keys=True
+        )
+        return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+    
+    @staticmethod
+    def is_cacheable(content: str) -> bool:
+        """False for empty answers and ones cut off with '...' / '…'"""
+        stripped = content.rstrip() if content else ""
+        return bool(stripped) and not stripped.endswith(("...", "…"))
+    
+    def get(self, key: str) -> Optional[str]:
+        if self._disk is not None:
+            return self._disk.get(key)
+        with self._lock:
+            content = self._memory.get(key)
+            if content is not None:
+                self._memory.move_to_end(key)
+            return content
+    
+    def set(self, key: str, content: str):
+        if not self.is_cacheable(content):
+            return
+        if self._disk is not None:
+            self._disk.set(key, content)
+            return
+        with self._lock:
+            self._memory[key] = content
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.MEMORY_MAX_ENTRIES:
+                self._memory.popitem(last=False)
+
+
+_response_cache: Optional[ResponseCache] = None
+
+
+def get_response_cache() -> ResponseCache:
+    """Get global response cache instance"""
+    global _response_cache
+    if _response_cache is None:
+        _response_cache = ResponseCache()
+    return _response_cache
+
+
 class LLMClient:
     """Unified LLM Client with multi-provider support"""
     
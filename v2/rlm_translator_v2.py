@@ -2,11 +2,13 @@
 RLM-Trans Main Translator Engine v2
 With preset support for document type specific translations
 """
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from itertools import takewhile
 from typing import Optional, Dict, Any, List
 from dataclasses import dataclass
 
 from config import LLMConfig, LANGUAGE_NAMES
-from llm_client import LLMClient, LLMResponse
+from llm_client import LLMClient, LLMResponse, get_response_cache
 from repl_environment import TranslationREPL
 from presets_v1 import TranslationPreset, PresetManager, get_preset_manager, LLMParameters
 from text_utils import detect_language, chunk_text, clean_text, is_srt_format, parse_srt, format_srt
@@ -35,7 +37,10 @@ class RLMTranslatorV2:
     def __init__(self, 
                  llm_config: Optional[LLMConfig] = None,
                  preset_name: str = "general",
-                 progress_callback: Optional[callable] = None):
+                 progress_callback: Optional[callable] = None,
+                 chunk_callback: Optional[callable] = None,
+                 max_concurrency: int = 1,
+                 use_response_cache: bool = True):
         """
         Initialize the RLM translator v2.
         
@@ -43,9 +48,18 @@ class RLMTranslatorV2:
             llm_config: LLM provider configuration
             preset_name: Name of preset to use (subtitle, paper, patent, novel, technical, general)
             progress_callback: Optional callback for progress updates
+            chunk_callback: Optional callback(index, text) for each finished chunk
+            max_concurrency: Maximum chunk requests in flight (1 = sequential)
+            use_response_cache: Reuse earlier translations of identical requests
         """
         self.llm_config = llm_config or LLMConfig.from_env()
         self.progress_callback = progress_callback
+        self.chunk_callback = chunk_callback
+        self.max_concurrency = max_concurrency
+        self.use_response_cache = use_response_cache
+        # Model serving "auto" requests (e.g. the one loaded in LM Studio);
+        # only used to keep response cache entries apart per model
+        self.active_model: Optional[str] = None
         
         # Initialize preset manager
         self.preset_manager = get_preset_manager()
@@ -88,6 +102,11 @@ class RLMTranslatorV2:
         if self.progress_callback:
             self.progress_callback(message, progress)
     
+    def _report_chunk(self, index: int, text: str):
+        """Hand a finished chunk translation to the chunk callback"""
+        if self.chunk_callback:
+            self.chunk_callback(index, text)
+    
     def _get_llm_kwargs(self) -> Dict[str, Any]:
         """Get LLM parameters from current preset"""
         params = self._current_preset.llm_params
@@ -179,14 +198,8 @@ GLOSSARY (use these translations consistently):
         ]
         
         try:
-            response = self.llm_client.complete(
-                messages, 
-                is_sub_call=True,
-                **self._get_llm_kwargs()
-            )
-            
             return TranslationResult(
-                translated_text=response.content.strip(),
+                translated_text=self._complete_cached(messages),
                 source_lang=source_lang,
                 target_lang=target_lang,
                 chunks_count=1,
@@ -226,28 +239,16 @@ GLOSSARY (use these translations consistently):
         self._report_progress(f"Split into {total_chunks} chunks", 0.1)
         
         try:
-            translated_chunks = []
-            
-            for i, (start, end, chunk) in enumerate(chunks):
-                progress = 0.1 + (i / total_chunks) * 0.8
-                self._report_progress(f"Translating chunk {i+1}/{total_chunks}", progress)
-                
-                # Build context
-                context_summary = ""
-                if translated_chunks:
-                    last_chunk = translated_chunks[-1][-200:] if translated_chunks[-1] else ""
-                    context_summary = f"Previous translation ended with: ...{last_chunk}"
-                
-                # Call sub-agent with preset settings
-                translated = self._call_sub_agent(
-                    chunk, source_lang, target_lang,
-                    context_summary=context_summary,
-                    glossary=self.repl.state.glossary
+            if self.max_concurrency > 1 and total_chunks > 1:
+                translated_chunks = self._translate_chunks_concurrent(
+                    chunks, source_lang, target_lang
+                )
+                self.repl.state.translated_chunks.extend(translated_chunks)
+                self.repl.state.context_summary = f"Translated {total_chunks}/{total_chunks} chunks"
+            else:
+                translated_chunks = self._translate_chunks_sequential(
+                    chunks, source_lang, target_lang
                 )
-                
-                translated_chunks.append(translated)
-                self.repl.state.translated_chunks.append(translated)
-                self.repl.state.context_summary = f"Translated {i+1}/{total_chunks} chunks"
             
             final_text = ''.join(translated_chunks)
             self._report_progress("Translation complete", 1.0)
@@ -275,6 +276,79 @@ GLOSSARY (use these translations consistently):
                 error_message=str(e)
             )
     
+    def _translate_chunks_sequential(self, chunks, source_lang: str, target_lang: str) -> List[str]:
+        """Translate chunks one at a time, feeding each the previous translation's tail"""
+        total_chunks = len(chunks)
+        translated_chunks = []
+        
+        for i, (start, end, chunk) in enumerate(chunks):
+            progress = 0.1 + (i / total_chunks) * 0.8
+            self._report_progress(f"Translating chunk {i+1}/{total_chunks}", progress)
+            
+            # Build context
+            context_summary = ""
+            if translated_chunks:
+                last_chunk = translated_chunks[-1][-200:] if translated_chunks[-1] else ""
+                context_summary = f"Previous translation ended with: ...{last_chunk}"
+            
+            # Call sub-agent with preset settings
+            translated = self._call_sub_agent(
+                chunk, source_lang, target_lang,
+                context_summary=context_summary,
+                glossary=self.repl.state.glossary
+            )
+            
+            translated_chunks.append(translated)
+            self.repl.state.translated_chunks.append(translated)
+            self.repl.state.context_summary = f"Translated {i+1}/{total_chunks} chunks"
+            self._report_chunk(i, translated)
+        
+        return translated_chunks
+    
+    def _translate_chunks_concurrent(self, chunks, source_lang: str, target_lang: str) -> List[str]:
+        """
+        Translate chunks with up to max_concurrency requests in flight.
+        
+        The previous translation is not available yet when a chunk is
+        submitted, so each request gets the tail of the previous source
+        chunk as context instead. Results are returned in original order.
+        """
+        total_chunks = len(chunks)
+        results: List[Optional[str]] = [None] * total_chunks
+        glossary = self.repl.state.glossary
+        
+        with ThreadPoolExecutor(max_workers=min(self.max_concurrency, total_chunks)) as pool:
+            futures = {}
+            for i, (start, end, chunk) in enumerate(chunks):
+                context_summary = ""
+                if i > 0:
+                    context_summary = f"Previous source text ended with: ...{chunks[i - 1][2][-200:]}"
+                future = pool.submit(
+                    self._call_sub_agent, chunk, source_lang, target_lang,
+                    context_summary=context_summary, glossary=glossary
+                )
+                futures[future] = i
+            
+            try:
+                for done, future in enumerate(as_completed(futures), 1):
+                    index = futures[future]
+                    results[index] = future.result()
+                    self._report_chunk(index, results[index])
+                    self._report_progress(
+                        f"Translated chunk {done}/{total_chunks}",
+                        0.1 + (done / total_chunks) * 0.8
+                    )
+            except Exception:
+                for future in futures:
+                    future.cancel()
+                # Keep the in-order prefix so the partial result stays contiguous
+                self.repl.state.translated_chunks.extend(
+                    takewhile(lambda t: t is not None, results)
+                )
+                raise
+        
+        return results
+    
     def _call_sub_agent(self, chunk: str, source_lang: str, target_lang: str,
                         context_summary: str = "", glossary: Dict[str, str] = None) -> str:
         """Call sub-agent to translate a single chunk"""
@@ -289,12 +363,33 @@ GLOSSARY (use these translations consistently):
             {"role": "user", "content": chunk}
         ]
         
-        response = self.llm_client.complete(
-            messages, 
-            is_sub_call=True,
-            **self._get_llm_kwargs()
+        return self._complete_cached(messages)
+    
+    def _complete_cached(self, messages: List[Dict[str, str]]) -> str:
+        """
+        Sub-call completion through the response cache.
+        
+        The key covers provider, model, LLM parameters and the full messages
+        (preset prompt, languages, context, glossary and chunk), so editing
+        any of them misses the cache. Hits make no API call and add no cost.
+        """
+        llm_kwargs = self._get_llm_kwargs()
+        if not self.use_response_cache:
+            response = self.llm_client.complete(messages, is_sub_call=True, **llm_kwargs)
+            return response.content.strip()
+        
+        cache = get_response_cache()
+        key = cache.make_key(
+            self.llm_config.provider,
+            self.llm_config.sub_model or self.active_model or "auto",
+            messages, **llm_kwargs
         )
-        return response.content.strip()
+        content = cache.get(key)
+        if content is None:
+            response = self.llm_client.complete(messages, is_sub_call=True, **llm_kwargs)
+            content = response.content.strip()
+            cache.set(key, content)
+        return content
     
     def _translate_srt(self, text: str, source_lang: str, target_lang: str) -> TranslationResult:
         """Translate SRT subtitle file"""
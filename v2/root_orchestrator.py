@@ -9,7 +9,7 @@ from rlm_state import TranslationState, PresetType, QualityFlagType, RepairType
 from repl_environment_v2 import EnhancedREPL
 from sub_translator import SubTranslator
 from verifier import Verifier
-from context_package import build_context_package
+from context_package import GlossaryMatcher, build_context_package
 
 
 class RootOrchestrator:
@@ -52,7 +52,10 @@ class RootOrchestrator:
 
         # Initialize components
         self.sub_translator = SubTranslator(llm_config, preset_type, source_lang, target_lang)
-        self.verifier = Verifier(enable_llm_validation=enable_llm_validation)
+        self.verifier = Verifier(
+            enable_llm_validation=enable_llm_validation,
+            llm_client=self.sub_translator.llm_client
+        )
         self.repl = None  # Will be initialized when setting text
 
         # Callback tracking
@@ -61,6 +64,19 @@ class RootOrchestrator:
         self.last_cost_stats = (0.0, 0, 0)
         self.last_repair_history = []
 
+    def reset(self):
+        """
+        Clear per-run state so the same instance can translate another text.
+        The sub-translator, verifier and their LLM client are kept.
+        """
+        self.repl = None
+        self.sub_translator.glossary_matcher = None
+        self.sub_translator.llm_client.reset_costs()
+        self.last_progress_callback = None
+        self.last_quality_flags = []
+        self.last_cost_stats = (0.0, 0, 0)
+        self.last_repair_history = []
+
     def set_text(self, chunks: List[str]):
         """
         Set the text to translate.
@@ -75,16 +91,20 @@ class RootOrchestrator:
         self.repl.set_original_text(chunks)
         self.repl.state.total_chunks = len(chunks)
 
-    def set_glossary(self, glossary: dict):
+    def set_glossary(self, glossary: dict, matcher: Optional[GlossaryMatcher] = None):
         """
         Set custom glossary for translation.
 
         Args:
             glossary: Dictionary mapping source terms to target translations
+            matcher: Prebuilt GlossaryMatcher over glossary's keys (optional,
+                built here if omitted); limits each chunk's prompt to the
+                glossary terms it contains
         """
         if self.repl and glossary:
             for source, target in glossary.items():
                 self.repl.state.add_hard_term(source, target)
+            self.sub_translator.glossary_matcher = matcher or GlossaryMatcher(glossary)
 
     def _call_sub_translator(self, chunk: str) -> str:
         """
@@ -217,9 +237,16 @@ class RootOrchestrator:
                 retry_count=0
             )
             print(f"  [Step 5: REPAIR] Repair complete")
+            repair_type = validation_result.repair_type
+            self.on_rlm_repair(
+                repair_type.value if repair_type else "unknown",
+                f"Chunk {chunk_index + 1}: {validation_result.repair_description or 'repaired'}"
+            )
+            self.on_rlm_quality_flags(["REPAIRED"])
         else:
             print(f"  [Step 5: REPAIR] No repair needed (FRESH)")
             repaired_translation = translation
+            self.on_rlm_quality_flags(["FRESH"])
 
         # Step 6: Commit - Save final translation
         print(f"  [Step 6: COMMIT] Saving translation to REPL state...")
@@ -228,6 +255,10 @@ class RootOrchestrator:
             translation=repaired_translation
         )
         print(f"  [Step 6: COMMIT] Done")
+        cost_stats = self.sub_translator.llm_client.cost_summary()
+        self.on_rlm_cost_stats(
+            cost_stats.get("total_cost", 0.0), cost_stats.get("total_calls", 0), chunk_index + 1
+        )
 
         # Add context summary
         context_summary = f"Chunk {chunk_index+1}/{self.repl.state.total_chunks} completed successfully"
@@ -275,7 +306,7 @@ class RootOrchestrator:
         print(f"    [REPAIR] Repair type: {repair_type}")
         if hasattr(validation_result, 'errors') and validation_result.errors:
             for err in validation_result.errors:
-                print(f"    [REPAIR] Error: {err.get('message', 'Unknown')}")
+                print(f"    [REPAIR] Error: {err.message}")
         if hasattr(validation_result, 'warnings') and validation_result.warnings:
             for warn in validation_result.warnings:
                 print(f"    [REPAIR] Warning: {warn.get('message', 'Unknown')}")
@@ -408,12 +439,13 @@ class RootOrchestrator:
         # For now, re-translate completely
         return self._retranslate_chunk(chunk_index, original_chunk)
 
-    def run_full_translation(self, progress_callback=None) -> Dict[str, Any]:
+    def run_full_translation(self, progress_callback=None, chunk_callback=None) -> Dict[str, Any]:
         """
         Run complete translation of all chunks.
 
         Args:
             progress_callback: Optional callback for progress updates
+            chunk_callback: Optional callback(index, text) for each committed chunk
 
         Returns:
             Dict with final results and statistics
@@ -454,6 +486,11 @@ class RootOrchestrator:
             results.append(round_result)
             total_duration += round_result.get("duration", 0)
 
+            # Every round that committed a translation (including repaired
+            # ones, whose pre-repair validation reports success=False)
+            if chunk_callback and "translation" in round_result:
+                chunk_callback(round_result["chunk_index"], round_result["translation"])
+
             if round_result.get("success"):
                 success_count += 1
             else:
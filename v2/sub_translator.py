@@ -37,6 +37,8 @@ class SubTranslator:
         self.source_lang = source_lang
         self.target_lang = target_lang
         self.llm_client = LLMClient(llm_config)
+        # Set by RootOrchestrator.set_glossary; filters the user glossary per chunk
+        self.glossary_matcher = None
 
     def translate_chunk(
         self,
@@ -62,7 +64,8 @@ class SubTranslator:
             context_package = build_context_package(
                 state=state,
                 current_chunk_text=chunk_text,
-                current_chunk_index=chunk_index
+                current_chunk_index=chunk_index,
+                glossary_matcher=self.glossary_matcher
             )
 
             # Build messages for LLM using prompts.py
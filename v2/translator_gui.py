@@ -5,62 +5,177 @@ PyQt6 based graphical user interface for RLM translator
 import sys
 import os
 from pathlib import Path
-from typing import Optional
+from typing import Optional, TYPE_CHECKING
 
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QLabel, QComboBox, QTextEdit, QPushButton, QFileDialog,
-    QProgressBar, QGroupBox, QFormLayout, QLineEdit, QTabWidget,
-    QMessageBox, QSplitter, QStatusBar
+    QProgressBar, QGroupBox, QFormLayout, QMessageBox, QSplitter,
+    QStatusBar
+)
+from PyQt6.QtCore import (
+    Qt, QObject, QThread, QThreadPool, QRunnable, QTimer, pyqtSignal, pyqtSlot,
+    QFile, QIODevice, QTextStream, QStringConverter
 )
-from PyQt6.QtCore import Qt, QThread, pyqtSignal
 from PyQt6.QtGui import QFont, QAction
 
-from config import LLMConfig, TranslationConfig, LANGUAGE_NAMES_KO
-from rlm_translator import RLMTranslator, TranslationResult
+from config import LLMConfig
+
+if TYPE_CHECKING:
+    # Imported lazily at runtime so the window can paint before the
+    # translator stack (LLM clients, text utilities) is loaded.
+    from rlm_translator import RLMTranslator
+
+
+# Application-wide stylesheet, parsed once in main()
+_APP_QSS = """
+    QPushButton#translateBtn {
+        background-color: #4CAF50;
+        color: white;
+        font-size: 14px;
+        font-weight: bold;
+        border-radius: 5px;
+    }
+    QPushButton#translateBtn:hover {
+        background-color: #45a049;
+    }
+    QPushButton#translateBtn:disabled {
+        background-color: #cccccc;
+    }
+"""
+
+
+class TranslationCancelled(Exception):
+    """Raised from the progress callback to stop a cancelled job between chunks"""
+
 
+class TranslationWorker(QObject):
+    """Translation worker living on a persistent background thread.
 
-class TranslationWorker(QThread):
-    """Worker thread for translation to keep UI responsive"""
-    progress = pyqtSignal(str, float)
-    finished = pyqtSignal(object)
-    error = pyqtSignal(str)
+    Every job carries an id; jobs with an id up to cancelled_through stop at
+    their next progress report and emit nothing further.
+    """
+    progress = pyqtSignal(int, int, str)  # job id, percent (0-100), message
+    # job id, translated_text, success, chunks_count, cost_summary, error_message
+    finished = pyqtSignal(int, str, bool, int, dict, str)
+    error = pyqtSignal(int, str)  # job id, message
     
-    def __init__(self, translator: RLMTranslator, text: str, 
-                 source_lang: str, target_lang: str):
+    def __init__(self):
         super().__init__()
-        self.translator = translator
-        self.text = text
-        self.source_lang = source_lang
-        self.target_lang = target_lang
+        self.translator: Optional["RLMTranslator"] = None
+        # Set from the GUI thread; a plain int store is atomic
+        self.cancelled_through = 0
+        
+    def _is_cancelled(self, job_id: int) -> bool:
+        return job_id <= self.cancelled_through
+        
+    @pyqtSlot(int, str, str, str)
+    def run_slot(self, job_id: int, text: str, source_lang: str, target_lang: str):
+        if self._is_cancelled(job_id):
+            return
+        
+        def report(msg: str, prog: float):
+            # The in-flight request can't be interrupted; unwind at the next report
+            if self._is_cancelled(job_id):
+                raise TranslationCancelled()
+            self.progress.emit(job_id, int(prog * 100), msg)
         
-    def run(self):
         try:
             # Set progress callback
-            self.translator.progress_callback = lambda msg, prog: self.progress.emit(msg, prog)
+            self.translator.progress_callback = report
             
             result = self.translator.translate(
-                self.text,
-                source_lang=self.source_lang,
-                target_lang=self.target_lang
+                text,
+                source_lang=source_lang,
+                target_lang=target_lang
             )
+            # The translator turns TranslationCancelled into a failed result
+            if self._is_cancelled(job_id):
+                return
             
-            self.finished.emit(result)
+            self.finished.emit(
+                job_id,
+                result.translated_text,
+                result.success,
+                result.chunks_count,
+                result.cost_summary,
+                result.error_message or ""
+            )
+        except TranslationCancelled:
+            pass
+        except Exception as e:
+            if not self._is_cancelled(job_id):
+                self.error.emit(job_id, str(e))
+
+
+class ConnectionTestSignals(QObject):
+    """Signals for ConnectionTestRunnable (QRunnable cannot emit itself)"""
+    finished = pyqtSignal(bool)
+
+
+class ConnectionTestRunnable(QRunnable):
+    """Runs the LLM connection test on the global thread pool"""
+    
+    def __init__(self, translator: "RLMTranslator"):
+        super().__init__()
+        self.translator = translator
+        self.signals = ConnectionTestSignals()
+        
+    def run(self):
+        try:
+            ok = self.translator.test_connection()
+        except Exception:
+            ok = False
+        self.signals.finished.emit(ok)
+
+
+class FileSaveSignals(QObject):
+    """Signals for FileSaveRunnable"""
+    finished = pyqtSignal(str, str)  # file_path, error message ("" on success)
+
+
+class FileSaveRunnable(QRunnable):
+    """Encodes text as UTF-8 and writes it to disk on the global thread pool"""
+    
+    def __init__(self, file_path: str, text: str):
+        super().__init__()
+        self.file_path = file_path
+        self.text = text
+        self.signals = FileSaveSignals()
+        
+    def run(self):
+        try:
+            data = memoryview(self.text.encode('utf-8'))
+            flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0)
+            fd = os.open(self.file_path, flags, 0o644)
+            try:
+                while data:
+                    written = os.write(fd, data)
+                    data = data[written:]
+            finally:
+                os.close(fd)
+            self.signals.finished.emit(self.file_path, "")
         except Exception as e:
-            self.error.emit(str(e))
+            self.signals.finished.emit(self.file_path, str(e))
 
 
 class RLMTranslatorGUI(QMainWindow):
     """Main GUI window for RLM Translator"""
+    translation_requested = pyqtSignal(int, str, str, str)  # job id, text, source, target
     
     def __init__(self):
         super().__init__()
-        self.translator: Optional[RLMTranslator] = None
-        self.worker: Optional[TranslationWorker] = None
+        self.translator: Optional["RLMTranslator"] = None
         self.current_file: Optional[Path] = None
+        self._translating = False
+        self._job_id = 0  # id of the latest translation job
+        self._closing = False  # closeEvent already waited once
         
         self.init_ui()
-        self.init_translator()
+        self.init_worker()
+        # Defer translator setup until the event loop runs so the window
+        # is painted before the translator modules are imported.
+        QTimer.singleShot(0, self.init_translator)
         
     def init_ui(self):
         """Initialize the user interface"""
@@ -135,6 +250,9 @@ class RLMTranslatorGUI(QMainWindow):
         self.source_text = QTextEdit()
         self.source_text.setFont(QFont("Malgun Gothic", 11))
         self.source_text.setPlaceholderText("번역할 텍스트를 입력하거나 파일을 불러오세요...")
+        # Frame + viewport cover every pixel, so skip painting the parent
+        # background underneath. The viewport keeps autoFillBackground.
+        self.source_text.setAttribute(Qt.WidgetAttribute.WA_OpaquePaintEvent, True)
         source_layout.addWidget(self.source_text)
         
         splitter.addWidget(source_widget)
@@ -161,6 +279,7 @@ class RLMTranslatorGUI(QMainWindow):
         self.target_text.setFont(QFont("Malgun Gothic", 11))
         self.target_text.setReadOnly(True)
         self.target_text.setPlaceholderText("번역 결과가 여기에 표시됩니다...")
+        self.target_text.setAttribute(Qt.WidgetAttribute.WA_OpaquePaintEvent, True)
         target_layout.addWidget(self.target_text)
         
         splitter.addWidget(target_widget)
@@ -176,6 +295,14 @@ class RLMTranslatorGUI(QMainWindow):
         self.progress_label = QLabel("")
         progress_layout.addWidget(self.progress_label)
         
+        # Progress updates are buffered and applied at most ~30 times/sec
+        self._latest_pct = 0
+        self._latest_msg = ""
+        self._progress_timer = QTimer(self)
+        self._progress_timer.setSingleShot(True)
+        self._progress_timer.setInterval(33)
+        self._progress_timer.timeout.connect(self._flush_progress)
+        
         main_layout.addLayout(progress_layout)
         
         # Translate button
@@ -185,21 +312,7 @@ class RLMTranslatorGUI(QMainWindow):
         self.translate_btn = QPushButton("번역 시작")
         self.translate_btn.setMinimumWidth(150)
         self.translate_btn.setMinimumHeight(40)
-        self.translate_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #4CAF50;
-                color: white;
-                font-size: 14px;
-                font-weight: bold;
-                border-radius: 5px;
-            }
-            QPushButton:hover {
-                background-color: #45a049;
-            }
-            QPushButton:disabled {
-                background-color: #cccccc;
-            }
-        """)
+        self.translate_btn.setObjectName("translateBtn")  # styled by _APP_QSS
         self.translate_btn.clicked.connect(self.start_translation)
         button_layout.addWidget(self.translate_btn)
         
@@ -252,9 +365,25 @@ class RLMTranslatorGUI(QMainWindow):
         about_action.triggered.connect(self.show_about)
         help_menu.addAction(about_action)
     
+    def init_worker(self):
+        """Start the persistent worker thread that runs translations"""
+        self._thread = QThread(self)
+        self.worker = TranslationWorker()
+        self.worker.moveToThread(self._thread)
+        
+        queued = Qt.ConnectionType.QueuedConnection
+        self.translation_requested.connect(self.worker.run_slot, queued)
+        self.worker.progress.connect(self.on_progress, queued)
+        self.worker.finished.connect(self.on_translation_finished, queued)
+        self.worker.error.connect(self.on_translation_error, queued)
+        
+        self._thread.start()
+    
     def init_translator(self):
         """Initialize the translator"""
         try:
+            from rlm_translator import RLMTranslator
+            
             config = LLMConfig.from_env()
             self.translator = RLMTranslator(llm_config=config)
             
@@ -278,6 +407,8 @@ class RLMTranslatorGUI(QMainWindow):
         config.provider = provider
         
         try:
+            from rlm_translator import RLMTranslator
+            
             self.translator = RLMTranslator(llm_config=config)
             self.refresh_models()
             self.status_bar.showMessage(f"{provider_name} 프로바이더로 변경됨")
@@ -286,17 +417,25 @@ class RLMTranslatorGUI(QMainWindow):
     
     def refresh_models(self):
         """Refresh available models"""
-        self.model_combo.clear()
-        
-        if self.translator:
-            try:
-                models = self.translator.list_models()
-                if models:
-                    self.model_combo.addItems(models)
-                else:
-                    self.model_combo.addItem("(모델 없음)")
-            except:
-                self.model_combo.addItem("(연결 실패)")
+        # Repopulate in one batch: no per-item signals or relayouts
+        self.model_combo.blockSignals(True)
+        self.model_combo.setUpdatesEnabled(False)
+        try:
+            self.model_combo.clear()
+            
+            if self.translator:
+                try:
+                    models = self.translator.list_models()
+                    if models:
+                        self.model_combo.addItems(models)
+                    else:
+                        self.model_combo.addItem("(모델 없음)")
+                except:
+                    self.model_combo.addItem("(연결 실패)")
+        finally:
+            self.model_combo.setUpdatesEnabled(True)
+            self.model_combo.blockSignals(False)
+        self.model_combo.currentTextChanged.emit(self.model_combo.currentText())
     
     def test_connection(self):
         """Test LLM connection"""
@@ -305,8 +444,19 @@ class RLMTranslatorGUI(QMainWindow):
             return
         
         self.status_bar.showMessage("연결 테스트 중...")
+        self.test_btn.setEnabled(False)
         
-        if self.translator.test_connection():
+        runnable = ConnectionTestRunnable(self.translator)
+        runnable.signals.finished.connect(
+            self.on_connection_tested, Qt.ConnectionType.QueuedConnection
+        )
+        QThreadPool.globalInstance().start(runnable)
+    
+    def on_connection_tested(self, ok: bool):
+        """Handle connection test result"""
+        self.test_btn.setEnabled(True)
+        
+        if ok:
             QMessageBox.information(self, "성공", "LLM 서버에 연결되었습니다.")
             self.refresh_models()
             self.status_bar.showMessage("연결 성공")
@@ -316,24 +466,39 @@ class RLMTranslatorGUI(QMainWindow):
     
     def load_file(self):
         """Load text file"""
-        file_path, _ = QFileDialog.getOpenFileName(
+        dialog = QFileDialog(
             self, "파일 열기", "",
             "텍스트 파일 (*.txt *.srt *.md);;모든 파일 (*.*)"
         )
+        dialog.setFileMode(QFileDialog.FileMode.ExistingFile)
+        dialog.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
+        dialog.fileSelected.connect(self._on_open_file_chosen)
+        dialog.open()
+    
+    def _on_open_file_chosen(self, file_path: str):
+        """Read the file picked in the open dialog"""
+        if not file_path:
+            return
         
-        if file_path:
+        try:
+            # Decode with Qt's UTF-8 converter instead of Python's codec
+            f = QFile(file_path)
+            if not f.open(QIODevice.OpenModeFlag.ReadOnly):
+                raise OSError(f.errorString())
             try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                self.source_text.setPlainText(content)
-                self.current_file = Path(file_path)
-                self.status_bar.showMessage(f"파일 로드됨: {file_path}")
-            except Exception as e:
-                QMessageBox.warning(self, "오류", f"파일을 열 수 없습니다: {e}")
+                stream = QTextStream(f)
+                stream.setEncoding(QStringConverter.Encoding.Utf8)
+                self.source_text.setPlainText(stream.readAll())
+            finally:
+                f.close()
+            self.current_file = Path(file_path)
+            self.status_bar.showMessage(f"파일 로드됨: {file_path}")
+        except Exception as e:
+            QMessageBox.warning(self, "오류", f"파일을 열 수 없습니다: {e}")
     
     def save_file(self):
         """Save translation result"""
-        if not self.target_text.toPlainText():
+        if self.target_text.document().isEmpty():
             return
         
         # Suggest file name
@@ -342,18 +507,33 @@ class RLMTranslatorGUI(QMainWindow):
             target_lang = self._get_target_lang_code()
             suggested = str(self.current_file.parent / f"{self.current_file.stem}_{target_lang}{self.current_file.suffix}")
         
-        file_path, _ = QFileDialog.getSaveFileName(
+        dialog = QFileDialog(
             self, "저장", suggested,
             "텍스트 파일 (*.txt);;SRT 자막 (*.srt);;모든 파일 (*.*)"
         )
+        dialog.setAcceptMode(QFileDialog.AcceptMode.AcceptSave)
+        dialog.setFileMode(QFileDialog.FileMode.AnyFile)
+        dialog.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
+        dialog.fileSelected.connect(self._on_save_file_chosen)
+        dialog.open()
+    
+    def _on_save_file_chosen(self, file_path: str):
+        """Write the translation to the file picked in the save dialog"""
+        if not file_path:
+            return
         
-        if file_path:
-            try:
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    f.write(self.target_text.toPlainText())
-                self.status_bar.showMessage(f"저장됨: {file_path}")
-            except Exception as e:
-                QMessageBox.warning(self, "오류", f"저장 실패: {e}")
+        runnable = FileSaveRunnable(file_path, self.target_text.toPlainText())
+        runnable.signals.finished.connect(
+            self.on_file_saved, Qt.ConnectionType.QueuedConnection
+        )
+        QThreadPool.globalInstance().start(runnable)
+    
+    def on_file_saved(self, file_path: str, error: str):
+        """Handle background save completion"""
+        if error:
+            QMessageBox.warning(self, "오류", f"저장 실패: {error}")
+        else:
+            self.status_bar.showMessage(f"저장됨: {file_path}")
     
     def copy_result(self):
         """Copy result to clipboard"""
@@ -393,68 +573,97 @@ class RLMTranslatorGUI(QMainWindow):
         self.progress_bar.setValue(0)
         self.target_text.clear()
         
-        # Create worker thread
-        self.worker = TranslationWorker(
-            self.translator,
+        # Dispatch to the worker thread
+        self.worker.translator = self.translator
+        self._translating = True
+        self._job_id += 1
+        self.translation_requested.emit(
+            self._job_id,
             text,
             self._get_source_lang_code(),
             self._get_target_lang_code()
         )
-        
-        self.worker.progress.connect(self.on_progress)
-        self.worker.finished.connect(self.on_translation_finished)
-        self.worker.error.connect(self.on_translation_error)
-        
-        self.worker.start()
     
     def cancel_translation(self):
         """Cancel ongoing translation"""
-        if self.worker and self.worker.isRunning():
-            self.worker.terminate()
-            self.worker.wait()
-            self.on_translation_finished(None)
+        if self._translating:
+            # The job stops at its next progress report; anything it still
+            # emits carries a stale id and is ignored
+            self.worker.cancelled_through = self._job_id
+            self._reset_translation_ui()
             self.status_bar.showMessage("번역 취소됨")
     
-    def on_progress(self, message: str, progress: float):
+    def on_progress(self, job_id: int, percent: int, message: str):
         """Handle progress update"""
-        self.progress_bar.setValue(int(progress * 100))
-        self.progress_label.setText(message)
-        self.status_bar.showMessage(message)
+        if job_id != self._job_id or not self._translating:
+            return
+        self._latest_pct = percent
+        self._latest_msg = message
+        if not self._progress_timer.isActive():
+            self._progress_timer.start()
     
-    def on_translation_finished(self, result: Optional[TranslationResult]):
-        """Handle translation completion"""
+    def _flush_progress(self):
+        """Apply the most recent buffered progress update"""
+        self.progress_bar.setValue(self._latest_pct)
+        self.progress_label.setText(self._latest_msg)
+        self.status_bar.showMessage(self._latest_msg)
+    
+    def _reset_translation_ui(self):
+        """Restore controls after translation ends or is cancelled"""
+        self._translating = False
+        self._progress_timer.stop()
         self.translate_btn.setEnabled(True)
         self.cancel_btn.setVisible(False)
         self.progress_bar.setVisible(False)
         self.progress_label.setText("")
-        
-        if result is None:
+    
+    def on_translation_finished(self, job_id: int, translated_text: str, success: bool,
+                                chunks_count: int, cost_summary: dict,
+                                error_message: str):
+        """Handle translation completion"""
+        if job_id != self._job_id or not self._translating:
             return
+        self._reset_translation_ui()
         
-        if result.success:
-            self.target_text.setPlainText(result.translated_text)
+        if success:
+            self.target_text.setPlainText(translated_text)
             self.save_btn.setEnabled(True)
             self.copy_btn.setEnabled(True)
             
-            cost = result.cost_summary
             self.status_bar.showMessage(
-                f"번역 완료 - {result.chunks_count}개 청크, "
-                f"호출 {cost['total_calls']}회"
+                f"번역 완료 - {chunks_count}개 청크, "
+                f"호출 {cost_summary['total_calls']}회"
             )
         else:
-            if result.translated_text:
-                self.target_text.setPlainText(result.translated_text)
-            QMessageBox.warning(self, "오류", f"번역 중 오류 발생: {result.error_message}")
+            if translated_text:
+                self.target_text.setPlainText(translated_text)
+            QMessageBox.warning(self, "오류", f"번역 중 오류 발생: {error_message}")
     
-    def on_translation_error(self, error: str):
+    def on_translation_error(self, job_id: int, error: str):
         """Handle translation error"""
-        self.translate_btn.setEnabled(True)
-        self.cancel_btn.setVisible(False)
-        self.progress_bar.setVisible(False)
+        if job_id != self._job_id or not self._translating:
+            return
+        self._reset_translation_ui()
         
         QMessageBox.critical(self, "오류", f"번역 실패: {error}")
         self.status_bar.showMessage("번역 실패")
     
+    def closeEvent(self, event):
+        """Stop the worker thread before the window closes"""
+        # Let a running job unwind at its next progress report
+        self.worker.cancelled_through = self._job_id
+        self._thread.quit()
+        wait_ms = 2000 if not self._closing else 0
+        self._closing = True
+        if not self._thread.wait(wait_ms):
+            # Still inside a blocking LLM request; never terminate it. Hide
+            # the window and close once the job has unwound on its own
+            event.ignore()
+            self.hide()
+            QTimer.singleShot(200, self.close)
+            return
+        super().closeEvent(event)
+    
     def show_about(self):
         """Show about dialog"""
         QMessageBox.about(
@@ -470,6 +679,11 @@ class RLMTranslatorGUI(QMainWindow):
 def main():
     app = QApplication(sys.argv)
     app.setStyle("Fusion")
+    app.setStyleSheet(_APP_QSS)
+    # Combo popups may list hundreds of models; skip the open animations
+    for effect in (Qt.UIEffect.UI_AnimateCombo, Qt.UIEffect.UI_AnimateMenu,
+                   Qt.UIEffect.UI_AnimateTooltip, Qt.UIEffect.UI_FadeTooltip):
+        app.setEffectEnabled(effect, False)
     
     window = RLMTranslatorGUI()
     window.show()
@@ -3,19 +3,45 @@ RLM-Trans GUI v2
 PyQt6 GUI with preset support and LLM parameter editing
 """
 import sys
+import os
+import time
 import json
+import heapq
+import re
+import threading
+from collections import OrderedDict, deque
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional
 
+try:
+    import orjson  # optional, faster JSON parsing
+except ImportError:
+    orjson = None
+
+try:
+    import charset_normalizer  # optional, encoding detection (ships with requests)
+except ImportError:
+    charset_normalizer = None
+
+try:
+    import ijson  # optional, streaming import of large glossaries
+except ImportError:
+    ijson = None
+
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QLabel, QComboBox, QTextEdit, QPushButton, QFileDialog,
     QProgressBar, QGroupBox, QFormLayout, QLineEdit, QTabWidget,
     QMessageBox, QSplitter, QStatusBar, QDialog, QDialogButtonBox,
-    QSpinBox, QDoubleSpinBox, QCheckBox, QScrollArea
+    QSpinBox, QDoubleSpinBox, QCheckBox, QScrollArea, QTableView,
+    QHeaderView, QInputDialog, QButtonGroup, QPlainTextEdit
 )
-from PyQt6.QtCore import Qt, QThread, pyqtSignal
-from PyQt6.QtGui import QFont, QAction, QPixmap
+from PyQt6.QtCore import (
+    Qt, QThread, pyqtSignal, pyqtSlot, QAbstractTableModel, QModelIndex,
+    QObject, QRunnable, QThreadPool, QTimer
+)
+from PyQt6.QtGui import QFont, QAction, QPixmap, QTextCursor
 
 from config import LLMConfig
 from rlm_translator_v2 import RLMTranslatorV2, TranslationResult
@@ -23,6 +49,199 @@ from root_orchestrator import RootOrchestrator
 from presets_v1 import TranslationPreset, get_preset_manager, LLMParameters
 from rlm_state import PresetType
 from chunking_strategy import ChunkingStrategy
+from context_package import GlossaryMatcher
+
+
+# Parsed JSON files keyed by path -> ((mtime_ns, size), data), least
+# recently used first; files of _STREAM_IMPORT_THRESHOLD or more aren't kept
+_JSON_CACHE: OrderedDict = OrderedDict()
+_JSON_CACHE_SIZE = 8
+
+
+def _load_json_cached(path: str):
+    """Load a JSON file, reusing the parsed result while the file is unchanged.
+
+    The returned object is shared between callers and must not be mutated.
+    """
+    st = os.stat(path)
+    key = (st.st_mtime_ns, st.st_size)
+    cached = _JSON_CACHE.get(path)
+    if cached and cached[0] == key:
+        _JSON_CACHE.move_to_end(path)
+        return cached[1]
+    
+    raw = Path(path).read_bytes()
+    data = orjson.loads(raw) if orjson else json.loads(raw.decode('utf-8'))
+    if st.st_size >= _STREAM_IMPORT_THRESHOLD:
+        _JSON_CACHE.pop(path, None)
+        return data
+    _JSON_CACHE[path] = (key, data)
+    _JSON_CACHE.move_to_end(path)
+    while len(_JSON_CACHE) > _JSON_CACHE_SIZE:
+        _JSON_CACHE.popitem(last=False)
+    return data
+
+
+class _JsonWriteSignals(QObject):
+    """Signals for _JsonWriteTask"""
+    finished = pyqtSignal(str, str)  # file_path, error message ("" on success)
+
+
+class _JsonWriteTask(QRunnable):
+    """Serializes data to an indented UTF-8 JSON file on the global thread pool"""
+    
+    def __init__(self, file_path: str, data):
+        super().__init__()
+        self.file_path = file_path
+        self.data = data
+        self.signals = _JsonWriteSignals()
+    
+    def run(self):
+        try:
+            if orjson:
+                raw = orjson.dumps(self.data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+            else:
+                raw = json.dumps(self.data, ensure_ascii=False, indent=2).encode('utf-8')
+            Path(self.file_path).write_bytes(raw)
+            self.signals.finished.emit(self.file_path, "")
+        except Exception as e:
+            self.signals.finished.emit(self.file_path, str(e))
+
+
+def _start_json_write(file_path: str, data, on_finished):
+    """Write data as JSON in the background and call on_finished(path, error)"""
+    task = _JsonWriteTask(file_path, data)
+    task.signals.finished.connect(on_finished, Qt.ConnectionType.QueuedConnection)
+    QThreadPool.globalInstance().start(task)
+
+
+# Glossary files at least this large are streamed with ijson when available
+_STREAM_IMPORT_THRESHOLD = 8 * 1024 * 1024
+_STREAM_IMPORT_BATCH = 5000
+
+
+def _iter_glossary_json(file_path: str):
+    """Stream (source, target) pairs from a nested or flat glossary JSON file"""
+    with open(file_path, 'rb') as f:
+        found = False
+        for pair in ijson.kvitems(f, 'glossary'):
+            found = True
+            yield pair
+        if found:
+            return
+        
+        # An empty nested glossary yields nothing above; only a file without
+        # a top-level "glossary" key at all is a flat dict
+        f.seek(0)
+        for prefix, event, value in ijson.parse(f):
+            if prefix == '' and event == 'map_key' and value == 'glossary':
+                return
+        
+        f.seek(0)
+        yield from ijson.kvitems(f, '')
+
+
+class _JsonImportSignals(QObject):
+    """Signals for _JsonImportTask"""
+    batch = pyqtSignal(list)  # list of (source, target) pairs
+    finished = pyqtSignal(str, int, str)  # file_path, pair count, error message ("" on success)
+
+
+class _JsonImportTask(QRunnable):
+    """Streams glossary pairs from a large JSON file on the global thread pool"""
+    
+    def __init__(self, file_path: str):
+        super().__init__()
+        self.file_path = file_path
+        self.signals = _JsonImportSignals()
+    
+    def run(self):
+        count = 0
+        batch = []
+        try:
+            for pair in _iter_glossary_json(self.file_path):
+                batch.append(pair)
+                if len(batch) >= _STREAM_IMPORT_BATCH:
+                    self.signals.batch.emit(batch)
+                    count += len(batch)
+                    batch = []
+            if batch:
+                self.signals.batch.emit(batch)
+                count += len(batch)
+            self.signals.finished.emit(self.file_path, count, "")
+        except Exception as e:
+            self.signals.finished.emit(self.file_path, count, str(e))
+
+
+# "name_3" -> groups "3"; used to auto-increment save file names
+_TRAILING_NUM_RE = re.compile(r'_(\d+)$')
+
+# Loaded source files longer than this (in characters) are shown unwrapped
+_NOWRAP_THRESHOLD = 1_000_000
+
+# Source files larger than this (in characters) are appended in slices of
+# roughly _CHUNKED_LOAD_SLICE characters so the window keeps repainting
+_CHUNKED_LOAD_THRESHOLD = 200_000
+_CHUNKED_LOAD_SLICE = 65536
+
+# RLM step/cost/flag/repair updates and worker progress are applied at most
+# once per this interval (~30 Hz); bursts in between only keep the latest state
+_RLM_UPDATE_INTERVAL_MS = 33
+
+# Widget and menu signals in the main window are emitted and handled on the
+# GUI thread, so they skip AutoConnection's per-emit thread check
+_DIRECT = Qt.ConnectionType.DirectConnection
+
+# Combo box labels -> language codes
+_SRC_LANG_MAP = {"자동 감지": "auto", "한국어": "ko", "일본어": "ja", "영어": "en"}
+_TGT_LANG_MAP = {"한국어": "ko", "일본어": "ja", "영어": "en"}
+
+# Preset keys -> RLM preset types
+_PRESET_TYPE_MAP = {
+    "subtitle": PresetType.SUBTITLE,
+    "patent": PresetType.PATENT,
+    "paper": PresetType.PAPER,
+    "novel": PresetType.NOVEL,
+    "technical": PresetType.TECHNICAL,
+    "general": PresetType.GENERAL
+}
+
+
+# Fallback encodings for Korean text files, tried in order
+_FALLBACK_ENCODINGS = ('utf-8', 'cp949', 'euc-kr', 'utf-16', 'latin-1')
+
+
+def _decode_text(raw: bytes):
+    """Decode file bytes read once from disk; returns (text, encoding).
+
+    UTF-8 is tried first. Otherwise the encoding is detected from a 64 KB
+    sample with charset_normalizer (if installed) before falling back to
+    the fixed candidate list. Newlines are normalized like text-mode open().
+    """
+    candidates = list(_FALLBACK_ENCODINGS)
+    try:
+        text = raw.decode('utf-8')
+        return _normalize_newlines(text), 'utf-8'
+    except UnicodeDecodeError:
+        candidates.remove('utf-8')
+    
+    if charset_normalizer is not None:
+        best = charset_normalizer.from_bytes(raw[:65536]).best()
+        if best is not None and best.encoding:
+            candidates.insert(0, best.encoding)
+    
+    for encoding in candidates:
+        try:
+            return _normalize_newlines(raw.decode(encoding)), encoding
+        except (UnicodeDecodeError, UnicodeError, LookupError):
+            continue
+    return None, None
+
+
+def _normalize_newlines(text: str) -> str:
+    if '\r' in text:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    return text
 
 
 class PresetEditorDialog(QDialog):
@@ -143,6 +362,26 @@ class PresetEditorDialog(QDialog):
         buttons.rejected.connect(self.reject)
         layout.addWidget(buttons)
     
+    def set_preset(self, preset: TranslationPreset):
+        """Load another preset into the existing widgets"""
+        self.preset = preset
+        self.setWindowTitle(f"프리셋 편집: {preset.name}")
+        
+        self.name_edit.setText(preset.name)
+        self.desc_edit.setText(preset.description)
+        self.type_edit.setText(preset.document_type)
+        
+        self.temp_spin.setValue(preset.llm_params.temperature)
+        self.max_tokens_spin.setValue(preset.llm_params.max_tokens)
+        self.top_p_spin.setValue(preset.llm_params.top_p)
+        
+        self.chunk_spin.setValue(preset.chunk_size)
+        self.preserve_format_check.setChecked(preset.preserve_formatting)
+        self.use_glossary_check.setChecked(preset.use_glossary)
+        
+        self.style_edit.setText(preset.style_guide)
+        self.prompt_edit.setPlainText(preset.system_prompt)
+    
     def get_updated_preset(self) -> TranslationPreset:
         """Get preset with updated values"""
         self.preset.name = self.name_edit.text()
@@ -163,6 +402,92 @@ class PresetEditorDialog(QDialog):
         return self.preset
 
 
+class GlossaryModel(QAbstractTableModel):
+    """Two-column (source, target) table model backed by a plain list"""
+    
+    HEADERS = ("원본 (Source)", "번역 (Target)")
+    
+    def __init__(self, glossary=None, editable: bool = True, parent=None):
+        """glossary may be a dict or an iterable of (source, target) pairs"""
+        super().__init__(parent)
+        pairs = glossary.items() if isinstance(glossary, dict) else (glossary or ())
+        self._items = [[str(k), str(v)] for k, v in pairs]
+        self._editable = editable
+    
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._items)
+    
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else 2
+    
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        if role in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole):
+            return self._items[index.row()][index.column()]
+        return None
+    
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+    
+    def flags(self, index):
+        flags = Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+        if self._editable:
+            flags |= Qt.ItemFlag.ItemIsEditable
+        return flags
+    
+    def setData(self, index, value, role=Qt.ItemDataRole.EditRole):
+        if not index.isValid() or role != Qt.ItemDataRole.EditRole:
+            return False
+        self._items[index.row()][index.column()] = str(value)
+        self.dataChanged.emit(index, index, [role])
+        return True
+    
+    def insertRows(self, row, count, parent=QModelIndex()) -> bool:
+        self.beginInsertRows(parent, row, row + count - 1)
+        self._items[row:row] = [["", ""] for _ in range(count)]
+        self.endInsertRows()
+        return True
+    
+    def removeRows(self, row, count, parent=QModelIndex()) -> bool:
+        self.beginRemoveRows(parent, row, row + count - 1)
+        del self._items[row:row + count]
+        self.endRemoveRows()
+        return True
+    
+    def set_items(self, glossary):
+        """Replace all rows with a dict or list of pairs"""
+        pairs = glossary.items() if isinstance(glossary, dict) else glossary
+        self.beginResetModel()
+        self._items = [[str(k), str(v)] for k, v in pairs]
+        self.endResetModel()
+    
+    def append_items(self, glossary):
+        """Append a dict or list of pairs with a single insert notification"""
+        if not glossary:
+            return
+        pairs = glossary.items() if isinstance(glossary, dict) else glossary
+        start = len(self._items)
+        self.beginInsertRows(QModelIndex(), start, start + len(glossary) - 1)
+        self._items.extend([str(k), str(v)] for k, v in pairs)
+        self.endInsertRows()
+    
+    def clear(self):
+        self.set_items({})
+    
+    def get_glossary(self) -> dict:
+        """Rows with both source and target filled, whitespace-stripped"""
+        glossary = {}
+        for source, target in self._items:
+            source = source.strip()
+            target = target.strip()
+            if source and target:
+                glossary[source] = target
+        return glossary
+
+
 class GlossaryEditorDialog(QDialog):
     """Dialog for editing glossary entries"""
     
@@ -182,16 +507,14 @@ class GlossaryEditorDialog(QDialog):
         layout.addWidget(info_label)
         
         # Table for glossary entries
-        from PyQt6.QtWidgets import QTableWidget, QTableWidgetItem, QHeaderView
-        
-        self.table = QTableWidget()
-        self.table.setColumnCount(2)
-        self.table.setHorizontalHeaderLabels(["원본 (Source)", "번역 (Target)"])
+        self.model = GlossaryModel(self.glossary, parent=self)
+        self.table = QTableView()
+        self.table.setModel(self.model)
         self.table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
+        # Fixed row height: the view never measures cell contents to size rows
+        self.table.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
         self.table.setAlternatingRowColors(True)
-        
-        # Load existing glossary
-        self._load_glossary_to_table()
+        self.table.setSelectionBehavior(QTableView.SelectionBehavior.SelectRows)
         
         layout.addWidget(self.table)
         
@@ -216,9 +539,9 @@ class GlossaryEditorDialog(QDialog):
         # Import/Export buttons
         file_buttons = QHBoxLayout()
         
-        import_btn = QPushButton("📂 JSON 불러오기")
-        import_btn.clicked.connect(self.import_json)
-        file_buttons.addWidget(import_btn)
+        self.import_btn = QPushButton("📂 JSON 불러오기")
+        self.import_btn.clicked.connect(self.import_json)
+        file_buttons.addWidget(self.import_btn)
         
         export_btn = QPushButton("💾 JSON 저장")
         export_btn.clicked.connect(self.export_json)
@@ -235,35 +558,26 @@ class GlossaryEditorDialog(QDialog):
         button_box.rejected.connect(self.reject)
         layout.addWidget(button_box)
     
-    def _load_glossary_to_table(self):
-        """Load glossary dictionary to table"""
-        from PyQt6.QtWidgets import QTableWidgetItem
-        
-        self.table.setRowCount(len(self.glossary))
-        for i, (source, target) in enumerate(self.glossary.items()):
-            self.table.setItem(i, 0, QTableWidgetItem(source))
-            self.table.setItem(i, 1, QTableWidgetItem(target))
-    
     def add_row(self):
         """Add a new empty row"""
-        row = self.table.rowCount()
-        self.table.insertRow(row)
+        row = self.model.rowCount()
+        self.model.insertRows(row, 1)
+        self.table.scrollToBottom()
     
     def remove_selected_rows(self):
         """Remove selected rows"""
-        rows = set(item.row() for item in self.table.selectedItems())
+        rows = set(index.row() for index in self.table.selectionModel().selectedIndexes())
         for row in sorted(rows, reverse=True):
-            self.table.removeRow(row)
+            self.model.removeRows(row, 1)
     
     def clear_all(self):
         """Clear all rows"""
-        from PyQt6.QtWidgets import QMessageBox
         reply = QMessageBox.question(
             self, "확인", "모든 용어를 삭제하시겠습니까?",
             QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
         )
         if reply == QMessageBox.StandardButton.Yes:
-            self.table.setRowCount(0)
+            self.model.clear()
     
     def import_json(self):
         """Import glossary from JSON file"""
@@ -273,8 +587,11 @@ class GlossaryEditorDialog(QDialog):
         )
         if file_path:
             try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
+                if ijson and os.path.getsize(file_path) >= _STREAM_IMPORT_THRESHOLD:
+                    self._import_json_streamed(file_path)
+                    return
+                
+                data = _load_json_cached(file_path)
                 
                 # Support both flat dict and nested format
                 if isinstance(data, dict):
@@ -283,19 +600,35 @@ class GlossaryEditorDialog(QDialog):
                     else:
                         glossary = data
                     
-                    # Merge with existing
-                    current_count = self.table.rowCount()
-                    for source, target in glossary.items():
-                        self.table.insertRow(current_count)
-                        from PyQt6.QtWidgets import QTableWidgetItem
-                        self.table.setItem(current_count, 0, QTableWidgetItem(str(source)))
-                        self.table.setItem(current_count, 1, QTableWidgetItem(str(target)))
-                        current_count += 1
+                    # Merge with existing (one repaint for the whole batch)
+                    self.table.setSortingEnabled(False)
+                    self.table.setUpdatesEnabled(False)
+                    try:
+                        self.model.append_items(glossary)
+                    finally:
+                        self.table.setUpdatesEnabled(True)
                     
                     QMessageBox.information(self, "성공", f"{len(glossary)}개 용어를 불러왔습니다.")
             except Exception as e:
                 QMessageBox.warning(self, "오류", f"불러오기 실패: {e}")
     
+    def _import_json_streamed(self, file_path: str):
+        """Append a large glossary file in batches parsed off the GUI thread"""
+        self.import_btn.setEnabled(False)
+        self.table.setSortingEnabled(False)
+        self._import_task = _JsonImportTask(file_path)
+        self._import_task.signals.batch.connect(self.model.append_items, Qt.ConnectionType.QueuedConnection)
+        self._import_task.signals.finished.connect(self._on_import_finished, Qt.ConnectionType.QueuedConnection)
+        QThreadPool.globalInstance().start(self._import_task)
+    
+    def _on_import_finished(self, file_path: str, count: int, error: str):
+        self._import_task = None
+        self.import_btn.setEnabled(True)
+        if error:
+            QMessageBox.warning(self, "오류", f"불러오기 실패: {error}")
+        else:
+            QMessageBox.information(self, "성공", f"{count}개 용어를 불러왔습니다.")
+    
     def export_json(self):
         """Export glossary to JSON file"""
         file_path, _ = QFileDialog.getSaveFileName(
@@ -303,28 +636,48 @@ class GlossaryEditorDialog(QDialog):
             "JSON 파일 (*.json)"
         )
         if file_path:
-            try:
-                glossary = self.get_glossary()
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    json.dump({"glossary": glossary}, f, ensure_ascii=False, indent=2)
-                QMessageBox.information(self, "성공", f"저장됨: {file_path}")
-            except Exception as e:
-                QMessageBox.warning(self, "오류", f"저장 실패: {e}")
+            glossary = self.get_glossary()
+            _start_json_write(file_path, {"glossary": glossary}, self._on_export_finished)
+    
+    def _on_export_finished(self, file_path: str, error: str):
+        if error:
+            QMessageBox.warning(self, "오류", f"저장 실패: {error}")
+        else:
+            QMessageBox.information(self, "성공", f"저장됨: {file_path}")
+    
+    def set_glossary(self, glossary: dict):
+        """Replace the table contents when the dialog is shown again"""
+        self.glossary = glossary
+        self.table.setUpdatesEnabled(False)
+        try:
+            self.model.set_items(glossary)
+        finally:
+            self.table.setUpdatesEnabled(True)
     
     def get_glossary(self) -> dict:
         """Get glossary dictionary from table"""
-        glossary = {}
-        for row in range(self.table.rowCount()):
-            source_item = self.table.item(row, 0)
-            target_item = self.table.item(row, 1)
-            
-            if source_item and target_item:
-                source = source_item.text().strip()
-                target = target_item.text().strip()
-                if source and target:
-                    glossary[source] = target
-        
-        return glossary
+        return self.model.get_glossary()
+
+# id(dict) -> (snapshot of the dict, its items sorted by key)
+_SORTED_CACHE: dict = {}
+
+
+def _sorted_items(data: dict) -> list:
+    """Return sorted(data.items()), reusing the last sort while data is unchanged.
+
+    The snapshot comparison is a linear C-level dict compare, which keeps
+    the cache correct if the dict is edited in place or its id is reused.
+    """
+    cached = _SORTED_CACHE.get(id(data))
+    if cached is not None and cached[0] == data:
+        return cached[1]
+    
+    items = sorted(data.items())
+    if len(_SORTED_CACHE) >= 8:
+        _SORTED_CACHE.clear()
+    _SORTED_CACHE[id(data)] = (dict(data), items)
+    return items
+
 
 class GlossaryViewerDialog(QDialog):
     """Dialog to view current RLM glossary state (Read-only view of learned terms)"""
@@ -344,6 +697,8 @@ class GlossaryViewerDialog(QDialog):
         layout = QVBoxLayout(self)
         
         tabs = QTabWidget()
+        # (model, "no data" label) per tab, refreshed by set_data()
+        self._tabs = []
         
         # Helper to create tabs
         def add_tab(data, title, desc):
@@ -352,23 +707,19 @@ class GlossaryViewerDialog(QDialog):
             
             t_layout.addWidget(QLabel(desc))
             
-            from PyQt6.QtWidgets import QTableWidget, QTableWidgetItem, QHeaderView
-            table = QTableWidget()
-            table.setColumnCount(2)
-            table.setHorizontalHeaderLabels(["원문 (Source)", "번역 (Target)"])
+            table = QTableView()
+            model = GlossaryModel(_sorted_items(data or {}), editable=False, parent=table)
+            table.setModel(model)
             table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
+            table.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
             
-            if data:
-                table.setRowCount(len(data))
-                for i, (k, v) in enumerate(sorted(data.items())):
-                    table.setItem(i, 0, QTableWidgetItem(str(k)))
-                    table.setItem(i, 1, QTableWidgetItem(str(v)))
-            else:
-                table.setRowCount(0)
-                t_layout.addWidget(QLabel("(데이터 없음)"))
+            empty_label = QLabel("(데이터 없음)")
+            empty_label.setVisible(not data)
+            t_layout.addWidget(empty_label)
                 
             t_layout.addWidget(table)
             tabs.addTab(widget, title)
+            self._tabs.append((model, empty_label))
 
         add_tab(self.confirmed_terms, "확정 용어 (Confirmed)", "이번 세션에서 확정/학습된 용어 목록입니다.")
         add_tab(self.hard_glossary, "필수 용어 (Hard)", "반드시 지켜야 하는 고정 용어집입니다.")
@@ -390,22 +741,83 @@ class GlossaryViewerDialog(QDialog):
         
         layout.addLayout(btn_box)
         
+    def set_data(self, hard_glossary: dict, soft_glossary: dict, confirmed_terms: dict):
+        """Show new glossary state in the existing tabs"""
+        self.hard_glossary = hard_glossary
+        self.soft_glossary = soft_glossary
+        self.confirmed_terms = confirmed_terms
+        
+        self.setUpdatesEnabled(False)
+        try:
+            for (model, empty_label), data in zip(
+                self._tabs, (confirmed_terms, hard_glossary, soft_glossary)
+            ):
+                model.set_items(_sorted_items(data or {}))
+                empty_label.setVisible(not data)
+        finally:
+            self.setUpdatesEnabled(True)
+    
     def export_glossary(self):
         file_path, _ = QFileDialog.getSaveFileName(
             self, "용어집 내보내기", "learned_glossary.json", "JSON Files (*.json)"
         )
         if file_path:
-            try:
-                data = {
-                    "confirmed": self.confirmed_terms,
-                    "hard": self.hard_glossary,
-                    "soft": self.soft_glossary
-                }
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    json.dump(data, f, ensure_ascii=False, indent=2)
-                QMessageBox.information(self, "성공", "용어집이 저장되었습니다.")
-            except Exception as e:
-                QMessageBox.warning(self, "오류", f"저장 실패: {e}")
+            # Shallow copies so the background write never sees the live
+            # RLM state dicts change underneath it
+            data = {
+                "confirmed": dict(self.confirmed_terms),
+                "hard": dict(self.hard_glossary),
+                "soft": dict(self.soft_glossary)
+            }
+            _start_json_write(file_path, data, self._on_export_finished)
+    
+    def _on_export_finished(self, file_path: str, error: str):
+        if error:
+            QMessageBox.warning(self, "오류", f"저장 실패: {error}")
+        else:
+            QMessageBox.information(self, "성공", "용어집이 저장되었습니다.")
+
+
+# Stylesheets for the RLM panels. Each panel applies one sheet and its
+# widgets are matched by object name (or the "compact" property), so Qt
+# parses a single sheet per panel instead of one per widget.
+_RLM_CONTROL_PANEL_QSS = """
+    QCheckBox#rlmToggle {
+        font-size: 12px;
+        font-weight: bold;
+        padding: 8px;
+        color: #666;
+        border: 2px solid #ccc;
+        border-radius: 4px;
+    }
+    QCheckBox#rlmToggle:checked {
+        background-color: #4CAF50;
+        border-color: #2E7D32;
+        color: white;
+    }
+    QCheckBox#rlmToggle::indicator {
+        width: 18px;
+        height: 18px;
+    }
+    QLabel#retriesLabel { font-size: 10px; color: #666; }
+    QCheckBox[compact="true"], QComboBox[compact="true"] { font-size: 10px; }
+"""
+
+_RLM_PROGRESS_PANEL_QSS = """
+    QLabel#stepLabel { font-size: 11px; font-weight: bold; color: #2196F3; }
+    QLabel#freshFlag, QLabel#repairedFlag, QLabel#failedFlag {
+        font-weight: bold;
+        font-size: 10px;
+        padding: 2px 4px;
+        border-radius: 2px;
+    }
+    QLabel#freshFlag { color: #4CAF50; background-color: #E8F5E9; }
+    QLabel#repairedFlag { color: #FF9800; background-color: #FFF3E0; }
+    QLabel#failedFlag { color: #F44336; background-color: #FFEBEE; }
+    QLabel#totalCostLabel { font-weight: bold; color: #FF5722; font-size: 10px; }
+    QLabel#totalCallsLabel, QLabel#chunksLabel { color: #607D8B; font-size: 10px; }
+    QLabel#repairHistoryLabel { color: #666; font-size: 10px; }
+"""
 
 
 class RLMControlPanel(QWidget):
@@ -423,24 +835,7 @@ class RLMControlPanel(QWidget):
 
         # RLM Mode Toggle - prominent
         self.rlm_mode_toggle = QCheckBox("Enable RLM Mode")
-        self.rlm_mode_toggle.setStyleSheet("""
-            QCheckBox {
-                font-size: 12px;
-                font-weight: bold;
-                padding: 8px;
-                background-color: #e8f5e9;
-                border: 2px solid #4CAF50;
-                border-radius: 4px;
-            }
-            QCheckBox:checked {
-                background-color: #4CAF50;
-                color: white;
-            }
-            QCheckBox::indicator {
-                width: 18px;
-                height: 18px;
-            }
-        """)
+        self.rlm_mode_toggle.setObjectName("rlmToggle")
         layout.addWidget(self.rlm_mode_toggle)
 
         # Connect signal
@@ -460,7 +855,7 @@ class RLMControlPanel(QWidget):
         self.retries_spin.setMaximumWidth(60)
         retries_row.addWidget(self.retries_spin)
         self.retries_label = QLabel("times")
-        self.retries_label.setStyleSheet("font-size: 10px; color: #666;")
+        self.retries_label.setObjectName("retriesLabel")
         retries_row.addWidget(self.retries_label)
         retries_row.addStretch()
         
@@ -471,13 +866,13 @@ class RLMControlPanel(QWidget):
         # LLM Validation
         self.llm_validation_check = QCheckBox("LLM Verify")
         self.llm_validation_check.setChecked(True)
-        self.llm_validation_check.setStyleSheet("font-size: 10px;")
+        self.llm_validation_check.setProperty("compact", True)
         settings_layout.addRow("Validation:", self.llm_validation_check)
 
         # Conflict Resolution
         self.conflict_combo = QComboBox()
         self.conflict_combo.addItems(["PRESET", "DOC_INIT", "MAJORITY", "RECENT"])
-        self.conflict_combo.setStyleSheet("font-size: 10px;")
+        self.conflict_combo.setProperty("compact", True)
         self.conflict_combo.setMaximumWidth(100)
         settings_layout.addRow("Glossary:", self.conflict_combo)
 
@@ -493,18 +888,20 @@ class RLMControlPanel(QWidget):
         self.paragraph_chunking = QCheckBox("문단 단위 청킹")
         self.paragraph_chunking.setChecked(True)
         self.paragraph_chunking.setToolTip("문단 단위로 청크를 나눕니다. 체크 해제시 단어 수 기반.")
-        self.paragraph_chunking.setStyleSheet("font-size: 10px;")
+        self.paragraph_chunking.setProperty("compact", True)
         chunking_layout.addWidget(self.paragraph_chunking)
         
         self.word_chunking = QCheckBox("단어 수 기반 청킹")
         self.word_chunking.setChecked(False)
         self.word_chunking.setToolTip("지정된 단어 수로 청크를 나눕니다.")
-        self.word_chunking.setStyleSheet("font-size: 10px;")
+        self.word_chunking.setProperty("compact", True)
         chunking_layout.addWidget(self.word_chunking)
         
         # Make them mutually exclusive
-        self.paragraph_chunking.toggled.connect(lambda checked: self.word_chunking.setChecked(not checked) if checked else None)
-        self.word_chunking.toggled.connect(lambda checked: self.paragraph_chunking.setChecked(not checked) if checked else None)
+        self.chunking_group = QButtonGroup(self)
+        self.chunking_group.setExclusive(True)
+        self.chunking_group.addButton(self.paragraph_chunking)
+        self.chunking_group.addButton(self.word_chunking)
         
         chunking_group.setLayout(chunking_layout)
         layout.addWidget(chunking_group)
@@ -518,13 +915,13 @@ class RLMControlPanel(QWidget):
         self.sentence_verify = QCheckBox("문장 단위 검토")
         self.sentence_verify.setChecked(True)
         self.sentence_verify.setToolTip("번역이 완전한 문장으로 끝나는지 확인합니다.")
-        self.sentence_verify.setStyleSheet("font-size: 10px;")
+        self.sentence_verify.setProperty("compact", True)
         verify_layout.addWidget(self.sentence_verify)
         
         self.length_verify = QCheckBox("길이 검토 (50%)")
         self.length_verify.setChecked(False)
         self.length_verify.setToolTip("번역 길이가 원본의 50% 이상인지 확인합니다.")
-        self.length_verify.setStyleSheet("font-size: 10px;")
+        self.length_verify.setProperty("compact", True)
         verify_layout.addWidget(self.length_verify)
         
         verify_group.setLayout(verify_layout)
@@ -532,28 +929,25 @@ class RLMControlPanel(QWidget):
 
         layout.addStretch()
         self.setLayout(layout)
-
-    def update_rlm_toggle_style(self):
-        """Update RLM toggle style based on state"""
-        if self.rlm_mode_toggle.isChecked():
-            self.rlm_mode_toggle.setStyleSheet("""
-                QCheckBox {
-                    color: #2E7D32;
-                    font-weight: bold;
-                    border: 2px solid #4CAF50;
-                    border-radius: 4px;
-                    padding: 4px 8px;
-                }
-            """)
-        else:
-            self.rlm_mode_toggle.setStyleSheet("""
-                QCheckBox {
-                    color: #666;
-                    border: 2px solid #ccc;
-                    border-radius: 4px;
-                    padding: 4px 8px;
-                }
-            """)
+        self.setStyleSheet(_RLM_CONTROL_PANEL_QSS)
+        
+        # Mirror control state in plain attributes so the getters below
+        # don't call into Qt every time they are polled
+        self._rlm_enabled = self.rlm_mode_toggle.isChecked()
+        self._max_retries = self.retries_spin.value()
+        self._llm_validation = self.llm_validation_check.isChecked()
+        self._conflict_resolution = self.conflict_combo.currentText()
+        self._paragraph_chunking = self.paragraph_chunking.isChecked()
+        self._sentence_verify = self.sentence_verify.isChecked()
+        self._length_verify = self.length_verify.isChecked()
+        
+        self.rlm_mode_toggle.toggled.connect(lambda v: setattr(self, '_rlm_enabled', v))
+        self.retries_spin.valueChanged.connect(lambda v: setattr(self, '_max_retries', v))
+        self.llm_validation_check.toggled.connect(lambda v: setattr(self, '_llm_validation', v))
+        self.conflict_combo.currentTextChanged.connect(lambda v: setattr(self, '_conflict_resolution', v))
+        self.paragraph_chunking.toggled.connect(lambda v: setattr(self, '_paragraph_chunking', v))
+        self.sentence_verify.toggled.connect(lambda v: setattr(self, '_sentence_verify', v))
+        self.length_verify.toggled.connect(lambda v: setattr(self, '_length_verify', v))
 
     def update_retries_label(self, value: int):
         self.retries_label.setText(f"{value}회")
@@ -564,25 +958,25 @@ class RLMControlPanel(QWidget):
         self.conflict_combo.setEnabled(enabled)
 
     def is_rlm_enabled(self) -> bool:
-        return self.rlm_mode_toggle.isChecked()
+        return self._rlm_enabled
 
     def get_max_retries(self) -> int:
-        return self.retries_spin.value()
+        return self._max_retries
 
     def is_llm_validation_enabled(self) -> bool:
-        return self.llm_validation_check.isChecked()
+        return self._llm_validation
 
     def get_conflict_resolution(self) -> str:
-        return self.conflict_combo.currentText()
+        return self._conflict_resolution
     
     def is_paragraph_chunking(self) -> bool:
-        return self.paragraph_chunking.isChecked()
+        return self._paragraph_chunking
     
     def is_sentence_verify(self) -> bool:
-        return self.sentence_verify.isChecked()
+        return self._sentence_verify
     
     def is_length_verify(self) -> bool:
-        return self.length_verify.isChecked()
+        return self._length_verify
 
     def on_toggle_changed(self, checked: bool):
         """Handle toggle change signal."""
@@ -595,6 +989,8 @@ class RLMProgressPanel(QWidget):
 
     def __init__(self, parent=None):
         super().__init__(parent)
+        # Most recent repair events shown in the Repair box
+        self._repair_events = deque(maxlen=50)
         self.init_ui()
 
     def init_ui(self):
@@ -609,7 +1005,7 @@ class RLMProgressPanel(QWidget):
         step_layout.setContentsMargins(5, 5, 5, 5)
 
         self.step_label = QLabel("Ready")
-        self.step_label.setStyleSheet("font-size: 11px; font-weight: bold; color: #2196F3;")
+        self.step_label.setObjectName("stepLabel")
         step_layout.addWidget(self.step_label)
 
         # Progress Bar
@@ -627,17 +1023,17 @@ class RLMProgressPanel(QWidget):
         flags_layout.setContentsMargins(5, 5, 5, 5)
 
         self.fresh_flag = QLabel("FRESH")
-        self.fresh_flag.setStyleSheet("color: #4CAF50; font-weight: bold; font-size: 10px; padding: 2px 4px; background-color: #E8F5E9; border-radius: 2px;")
+        self.fresh_flag.setObjectName("freshFlag")
         self.fresh_flag.setVisible(False)
         flags_layout.addWidget(self.fresh_flag)
 
         self.repaired_flag = QLabel("REPAIRED")
-        self.repaired_flag.setStyleSheet("color: #FF9800; font-weight: bold; font-size: 10px; padding: 2px 4px; background-color: #FFF3E0; border-radius: 2px;")
+        self.repaired_flag.setObjectName("repairedFlag")
         self.repaired_flag.setVisible(False)
         flags_layout.addWidget(self.repaired_flag)
 
         self.failed_flag = QLabel("FAILED")
-        self.failed_flag.setStyleSheet("color: #F44336; font-weight: bold; font-size: 10px; padding: 2px 4px; background-color: #FFEBEE; border-radius: 2px;")
+        self.failed_flag.setObjectName("failedFlag")
         self.failed_flag.setVisible(False)
         flags_layout.addWidget(self.failed_flag)
         
@@ -651,17 +1047,17 @@ class RLMProgressPanel(QWidget):
         cost_layout.setContentsMargins(5, 5, 5, 5)
 
         self.total_cost_label = QLabel("$0.00")
-        self.total_cost_label.setStyleSheet("font-weight: bold; color: #FF5722; font-size: 10px;")
+        self.total_cost_label.setObjectName("totalCostLabel")
         cost_layout.addWidget(QLabel("Cost:"))
         cost_layout.addWidget(self.total_cost_label)
 
         self.total_calls_label = QLabel("0")
-        self.total_calls_label.setStyleSheet("color: #607D8B; font-size: 10px;")
+        self.total_calls_label.setObjectName("totalCallsLabel")
         cost_layout.addWidget(QLabel("Calls:"))
         cost_layout.addWidget(self.total_calls_label)
 
         self.chunks_label = QLabel("0")
-        self.chunks_label.setStyleSheet("color: #607D8B; font-size: 10px;")
+        self.chunks_label.setObjectName("chunksLabel")
         cost_layout.addWidget(QLabel("Chunks:"))
         cost_layout.addWidget(self.chunks_label)
 
@@ -674,7 +1070,7 @@ class RLMProgressPanel(QWidget):
         repair_layout.setContentsMargins(5, 5, 5, 5)
 
         self.repair_history_label = QLabel("None")
-        self.repair_history_label.setStyleSheet("color: #666; font-size: 10px;")
+        self.repair_history_label.setObjectName("repairHistoryLabel")
         self.repair_history_label.setWordWrap(True)
         repair_layout.addWidget(self.repair_history_label)
 
@@ -682,6 +1078,7 @@ class RLMProgressPanel(QWidget):
         main_layout.addWidget(repair_group)
 
         self.setLayout(main_layout)
+        self.setStyleSheet(_RLM_PROGRESS_PANEL_QSS)
 
     def update_step(self, step_name: str):
         self.step_label.setText(step_name)
@@ -709,13 +1106,13 @@ class RLMProgressPanel(QWidget):
         self.chunks_label.setText(str(chunks))
 
     def add_repair_history(self, repair_type: str, message: str):
-        current = self.repair_history_label.text()
-        if current == "None":
-            self.repair_history_label.setText(f"[{repair_type}] {message}")
-        else:
-            self.repair_history_label.setText(
-                f"{current}; [{repair_type}] {message}"
-            )
+        self._repair_events.append(f"[{repair_type}] {message}")
+        self.repair_history_label.setText("; ".join(self._repair_events))
+
+    def add_repair_history_batch(self, events: list):
+        """Append several (repair_type, message) pairs with one label update"""
+        self._repair_events.extend(f"[{repair_type}] {message}" for repair_type, message in events)
+        self.repair_history_label.setText("; ".join(self._repair_events))
 
     def clear(self):
         self.step_label.setText("Ready")
@@ -727,35 +1124,129 @@ class RLMProgressPanel(QWidget):
         self.total_cost_label.setText("$0.00")
         self.total_calls_label.setText("0")
         self.chunks_label.setText("0")
+        self._repair_events.clear()
         self.repair_history_label.setText("None")
 
 
+@dataclass(slots=True)
+class RLMResult:
+    """RLM-mode result exposing the attributes on_finished reads from TranslationResult"""
+    success: bool
+    translated_text: str
+    chunks_count: int
+    total_cost: float
+    total_time: float
+    preset_used: str
+    cost_summary: dict
+    error_message: Optional[str] = None
+
+
+def _iter_lines(text: str):
+    """Yield the lines of text lazily; the inverse of '\n'.join"""
+    start = 0
+    while True:
+        end = text.find('\n', start)
+        if end < 0:
+            yield text[start:]
+            return
+        yield text[start:end]
+        start = end + 1
+
+
+class TranslationCancelled(Exception):
+    """Raised from the progress callback to stop a run between chunks"""
+
+
 class TranslationWorker(QThread):
     """Worker thread for translation"""
-    progress = pyqtSignal(str, float)
     finished = pyqtSignal(object)
     error = pyqtSignal(str)
     rlm_step = pyqtSignal(str)
     rlm_quality_flags = pyqtSignal(list)
     rlm_cost_stats = pyqtSignal(float, int, int)
+    rlm_repair = pyqtSignal(str, str)  # repair type, message
+    chunking_done = pyqtSignal(int)  # number of chunks (RLM mode)
+    chunk_done = pyqtSignal(int, str)  # chunk index, translated text
 
     def __init__(self, translator, text: str,
-                 source_lang: str, target_lang: str, use_rlm: bool = False):
+                 source_lang: str, target_lang: str, use_rlm: bool = False,
+                 chunk_size: int = 1000, by_paragraph: bool = False,
+                 glossary: Optional[dict] = None,
+                 glossary_matcher: Optional[GlossaryMatcher] = None):
         super().__init__()
         self.translator = translator
         self.text = text
         self.source_lang = source_lang
         self.target_lang = target_lang
         self.use_rlm = use_rlm
+        # RLM mode chunks and loads the text on this thread, not the GUI's
+        self.chunk_size = chunk_size
+        self.by_paragraph = by_paragraph
+        self.glossary = glossary
+        self.glossary_matcher = glossary_matcher
+        # Latest (message, progress); the window polls it instead of taking
+        # a queued signal per report
+        self.progress_queue: deque = deque(maxlen=1)
+        self._cancel_event = threading.Event()
+        self._repairs_sent = 0  # entries of last_repair_history already emitted
+
+    def cancel(self):
+        """Ask the run to stop at the next chunk boundary"""
+        self._cancel_event.set()
+
+    def _progress_callback(self, msg: str, prog: float):
+        """Publish progress for the window to poll (last write wins)"""
+        # Both engines report progress between chunks, so this is where a
+        # cancelled run unwinds (the in-flight request is allowed to finish)
+        if self._cancel_event.is_set():
+            raise TranslationCancelled()
+        self.progress_queue.append((msg, prog))
+
+    def _rlm_chunk_callback(self, index: int, text: str):
+        """Forward a committed RLM chunk and the round's panel state"""
+        self.chunk_done.emit(index, text)
+        orchestrator = self.translator
+        self.rlm_quality_flags.emit(list(orchestrator.last_quality_flags))
+        cost, calls, chunks = orchestrator.last_cost_stats
+        self.rlm_cost_stats.emit(float(cost), int(calls), int(chunks))
+        history = orchestrator.last_repair_history
+        for repair_type, message in history[self._repairs_sent:]:
+            self.rlm_repair.emit(repair_type, message)
+        self._repairs_sent = len(history)
+
+    def _chunk_text(self) -> list:
+        """Split the source based on the selected chunking option"""
+        chunker = ChunkingStrategy(chunk_size=self.chunk_size)
+
+        def show_warning(msg):
+            print(f"[CHUNKING WARNING] {msg}")
+        chunks = chunker.chunk_iter(
+            _iter_lines(self.text),
+            by_paragraph=self.by_paragraph,
+            show_warning_callback=show_warning
+        )
+        return [chunk[2] for chunk in chunks]
 
     def run(self):
         try:
             if self.use_rlm:
                 # RLM mode - use RootOrchestrator
-                def progress_callback(msg, prog):
-                    self.progress.emit(msg, prog)
+                chunks = self._chunk_text()
+                self.chunking_done.emit(len(chunks))
+                if self._cancel_event.is_set():
+                    return
+                self.translator.set_text(chunks)
                 
-                result_dict = self.translator.run_full_translation(progress_callback)
+                # Set custom glossary if defined
+                if self.glossary:
+                    self.translator.set_glossary(self.glossary, self.glossary_matcher)
+                    print(f"[GLOSSARY] {len(self.glossary)} terms loaded")
+                
+                result_dict = self.translator.run_full_translation(
+                    self._progress_callback, self._rlm_chunk_callback
+                )
+                if self._cancel_event.is_set():
+                    return
                 
                 # Create a simple result object with all required attributes
                 final_text = self.translator.get_final_result()
@@ -763,48 +1254,122 @@ class TranslationWorker(QThread):
                 total_cost = result_dict.get('total_cost', 0)
                 total_calls = result_dict.get('total_calls', 0)
                 
-                result = type('TranslationResult', (), {
-                    'success': True,
-                    'translated_text': final_text,
-                    'chunks_count': total_chunks,
-                    'total_cost': total_cost,
-                    'total_time': result_dict.get('total_time', 0),
-                    'preset_used': 'RLM Mode',
-                    'cost_summary': {
+                result = RLMResult(
+                    success=True,
+                    translated_text=final_text,
+                    chunks_count=total_chunks,
+                    total_cost=total_cost,
+                    total_time=result_dict.get('total_time', 0),
+                    preset_used='RLM Mode',
+                    cost_summary={
                         'total_calls': total_calls,
                         'total_cost': total_cost
-                    },
-                    'error_message': None
-                })()
+                    }
+                )
                 self.finished.emit(result)
             else:
                 # Non-RLM mode - use RLMTranslatorV2
-                self.translator.progress_callback = lambda msg, prog: self.progress.emit(msg, prog)
+                self.translator.progress_callback = self._progress_callback
+                self.translator.chunk_callback = self.chunk_done.emit
 
                 result = self.translator.translate(
                     self.text,
                     source_lang=self.source_lang,
                     target_lang=self.target_lang
                 )
+                # The translator turns TranslationCancelled into a failed result
+                if self._cancel_event.is_set():
+                    return
                 self.finished.emit(result)
+        except TranslationCancelled:
+            pass
+        except Exception as e:
+            if not self._cancel_event.is_set():
+                self.error.emit(str(e))
+
+
+class NetworkWorker(QObject):
+    """Runs blocking LLM server calls on a persistent background thread.
+
+    Every result carries the translator it was computed for, so the window
+    can drop replies that arrive after the provider was switched.
+    """
+    connection_tested = pyqtSignal(object, bool)  # translator, ok
+    models_listed = pyqtSignal(object, object)  # translator, list of names or None on failure
+    model_loaded = pyqtSignal(object, str, bool, str)  # translator, name, ok, error message
+
+    @pyqtSlot(object)
+    def test_connection(self, translator):
+        try:
+            ok = bool(translator.test_connection())
+        except Exception:
+            ok = False
+        self.connection_tested.emit(translator, ok)
+
+    @pyqtSlot(object)
+    def list_models(self, translator):
+        try:
+            models = translator.list_models()
+        except Exception:
+            models = None
+        self.models_listed.emit(translator, models)
+
+    @pyqtSlot(object, str)
+    def ensure_model_loaded(self, translator, model_name: str):
+        try:
+            ok = bool(translator.llm_client.ensure_model_loaded(model_name))
+            self.model_loaded.emit(translator, model_name, ok, "")
         except Exception as e:
-            self.error.emit(str(e))
+            self.model_loaded.emit(translator, model_name, False, str(e))
 
 
 class RLMTranslatorGUIv2(QMainWindow):
     """Main GUI window v2 with preset support"""
     
+    # Requests handed to NetworkWorker on its own thread
+    connection_test_requested = pyqtSignal(object)
+    models_requested = pyqtSignal(object)
+    model_load_requested = pyqtSignal(object, str)
+    
     def __init__(self):
         super().__init__()
         self.translator: Optional[RLMTranslatorV2] = None
         self.root_orchestrator: Optional[RootOrchestrator] = None
+        # Settings root_orchestrator was built with by start_translation
+        self._orch_sig: Optional[tuple] = None
         self.worker: Optional[TranslationWorker] = None
+        # Cancelled workers still finishing their last request
+        self._stale_workers: list = []
+        self._closing = False  # closeEvent already waited once
+        # Streamed result: next chunk index to append, min-heap of early ones
+        self._next_chunk_idx = 0
+        self._pending_chunks: list = []
         self.current_file: Optional[Path] = None
         self.preset_manager = get_preset_manager()
         self.use_rlm_mode: bool = False
         self.custom_glossary: dict = {}  # User-defined glossary
+        # Term matcher over custom_glossary, rebuilt only when it is edited
+        self._glossary_matcher: Optional[GlossaryMatcher] = None
+        self._source_load_gen = 0  # bumped to abandon an in-progress chunked load
+        self._source_loading = False
+        self._presets_cache: Optional[list] = None  # list_presets_with_info() snapshot
+        # Dialogs are built on first use and reused afterwards
+        self._glossary_viewer: Optional[GlossaryViewerDialog] = None
+        self._preset_editor: Optional[PresetEditorDialog] = None
+        self._glossary_editor: Optional[GlossaryEditorDialog] = None
+        # Latest RLM panel state not yet shown, see _flush_rlm_updates
+        self._pending_rlm_progress: Optional[tuple] = None
+        self._pending_rlm_flags: Optional[list] = None
+        self._pending_rlm_cost: Optional[tuple] = None
+        self._pending_rlm_repairs: list = []
+        self._rlm_flush_scheduled = False
+        # Polls the running worker's progress queue, see _drain_queues
+        self._poll_timer = QTimer(self)
+        self._poll_timer.setInterval(_RLM_UPDATE_INTERVAL_MS)
+        self._poll_timer.timeout.connect(self._drain_queues, _DIRECT)
 
         self.init_ui()
+        self.init_network_worker()
         self.init_translator()
 
         # Hide RLM advanced panels by default (toggle visible via checkbox)
@@ -830,15 +1395,15 @@ class RLMTranslatorGUIv2(QMainWindow):
         preset_select_layout = QHBoxLayout()
         self.preset_combo = QComboBox()
         self.preset_combo.setMinimumWidth(200)
-        self.preset_combo.currentTextChanged.connect(self.on_preset_changed_in_gui)
+        self.preset_combo.currentTextChanged.connect(self.on_preset_changed_in_gui, _DIRECT)
         preset_select_layout.addWidget(self.preset_combo)
 
         self.edit_preset_btn = QPushButton("편집")
-        self.edit_preset_btn.clicked.connect(self.edit_preset)
+        self.edit_preset_btn.clicked.connect(self.edit_preset, _DIRECT)
         preset_select_layout.addWidget(self.edit_preset_btn)
 
         self.save_preset_btn = QPushButton("저장")
-        self.save_preset_btn.clicked.connect(self.save_preset)
+        self.save_preset_btn.clicked.connect(self.save_preset, _DIRECT)
         preset_select_layout.addWidget(self.save_preset_btn)
 
         preset_layout.addLayout(preset_select_layout)
@@ -881,16 +1446,27 @@ class RLMTranslatorGUIv2(QMainWindow):
 
         self.provider_combo = QComboBox()
         self.provider_combo.addItems(["LM Studio", "OpenAI", "Gemini"])
-        self.provider_combo.currentTextChanged.connect(self.on_provider_changed)
+        self.provider_combo.currentTextChanged.connect(self.on_provider_changed, _DIRECT)
         llm_layout.addRow("프로바이더:", self.provider_combo)
 
         self.model_combo = QComboBox()
         self.model_combo.setMinimumWidth(150)
-        self.model_combo.currentTextChanged.connect(self.on_model_changed)
+        self.model_combo.currentTextChanged.connect(self.on_model_changed, _DIRECT)
         llm_layout.addRow("모델:", self.model_combo)
 
+        self.concurrency_spin = QSpinBox()
+        self.concurrency_spin.setRange(1, 16)
+        self.concurrency_spin.setValue(1)
+        self.concurrency_spin.setToolTip("일반 모드에서 동시에 보낼 청크 요청 수 (1 = 순차, 이전 번역을 문맥으로 사용)")
+        llm_layout.addRow("동시 요청:", self.concurrency_spin)
+
+        self.response_cache_check = QCheckBox("응답 캐시 사용")
+        self.response_cache_check.setChecked(True)
+        self.response_cache_check.setToolTip("같은 요청은 저장된 번역을 재사용합니다 (다시 번역하려면 해제)")
+        llm_layout.addRow("", self.response_cache_check)
+
         self.test_btn = QPushButton("연결 테스트")
-        self.test_btn.clicked.connect(self.test_connection)
+        self.test_btn.clicked.connect(self.test_connection, _DIRECT)
         llm_layout.addRow("", self.test_btn)
 
         llm_group.setLayout(llm_layout)
@@ -934,11 +1510,11 @@ class RLMTranslatorGUIv2(QMainWindow):
         source_header = QHBoxLayout()
         source_header.addWidget(QLabel("원문"))
         self.load_btn = QPushButton("파일 불러오기")
-        self.load_btn.clicked.connect(self.load_file)
+        self.load_btn.clicked.connect(self.load_file, _DIRECT)
         source_header.addWidget(self.load_btn)
         
         self.glossary_btn = QPushButton("📖 용어집")
-        self.glossary_btn.clicked.connect(self.edit_glossary)
+        self.glossary_btn.clicked.connect(self.edit_glossary, _DIRECT)
         self.glossary_btn.setToolTip("용어집 편집 - 일관된 용어 번역을 위해 사용")
         source_header.addWidget(self.glossary_btn)
         
@@ -947,10 +1523,15 @@ class RLMTranslatorGUIv2(QMainWindow):
         source_header.addWidget(self.char_count_label)
         source_layout.addLayout(source_header)
 
-        self.source_text = QTextEdit()
+        self.source_text = QPlainTextEdit()
         self.source_text.setFont(QFont("Malgun Gothic", 11))
         self.source_text.setPlaceholderText("번역할 텍스트를 입력하거나 파일을 불러오세요...")
-        self.source_text.textChanged.connect(self.update_char_count)
+        # Recount at most once per 150 ms burst of edits
+        self._char_count_timer = QTimer(self)
+        self._char_count_timer.setSingleShot(True)
+        self._char_count_timer.setInterval(150)
+        self._char_count_timer.timeout.connect(self._do_update_char_count, _DIRECT)
+        self.source_text.textChanged.connect(self.update_char_count, _DIRECT)
         source_layout.addWidget(self.source_text)
 
         text_splitter.addWidget(source_widget)
@@ -963,23 +1544,24 @@ class RLMTranslatorGUIv2(QMainWindow):
         target_header = QHBoxLayout()
         target_header.addWidget(QLabel("번역 결과"))
         self.save_btn = QPushButton("저장")
-        self.save_btn.clicked.connect(self.save_file)
+        self.save_btn.clicked.connect(self.save_file, _DIRECT)
         self.save_btn.setEnabled(False)
         target_header.addWidget(self.save_btn)
 
         self.glossary_view_btn = QPushButton("용어집 보기")
-        self.glossary_view_btn.clicked.connect(self.view_glossary)
+        self.glossary_view_btn.clicked.connect(self.view_glossary, _DIRECT)
         target_header.addWidget(self.glossary_view_btn)
         self.copy_btn = QPushButton("복사")
-        self.copy_btn.clicked.connect(self.copy_result)
+        self.copy_btn.clicked.connect(self.copy_result, _DIRECT)
         self.copy_btn.setEnabled(False)
         target_header.addWidget(self.copy_btn)
         target_header.addStretch()
         target_layout.addLayout(target_header)
 
-        self.target_text = QTextEdit()
+        self.target_text = QPlainTextEdit()
         self.target_text.setFont(QFont("Malgun Gothic", 11))
         self.target_text.setReadOnly(True)
+        self.target_text.setUndoRedoEnabled(False)  # read-only: no undo stack
         target_layout.addWidget(self.target_text)
 
         text_splitter.addWidget(target_widget)
@@ -1019,13 +1601,13 @@ class RLMTranslatorGUIv2(QMainWindow):
             QPushButton:hover { background-color: #45a049; }
             QPushButton:disabled { background-color: #cccccc; }
         """)
-        self.translate_btn.clicked.connect(self.start_translation)
+        self.translate_btn.clicked.connect(self.start_translation, _DIRECT)
         button_layout.addWidget(self.translate_btn)
         
         self.cancel_btn = QPushButton("취소")
         self.cancel_btn.setMinimumHeight(40)
         self.cancel_btn.setVisible(False)
-        self.cancel_btn.clicked.connect(self.cancel_translation)
+        self.cancel_btn.clicked.connect(self.cancel_translation, _DIRECT)
         button_layout.addWidget(self.cancel_btn)
         
         button_layout.addStretch()
@@ -1048,46 +1630,79 @@ class RLMTranslatorGUIv2(QMainWindow):
         
         open_action = QAction("열기...", self)
         open_action.setShortcut("Ctrl+O")
-        open_action.triggered.connect(self.load_file)
+        open_action.triggered.connect(self.load_file, _DIRECT)
         file_menu.addAction(open_action)
         
         save_action = QAction("저장...", self)
         save_action.setShortcut("Ctrl+S")
-        save_action.triggered.connect(self.save_file)
+        save_action.triggered.connect(self.save_file, _DIRECT)
         file_menu.addAction(save_action)
         
         file_menu.addSeparator()
         
         exit_action = QAction("종료", self)
-        exit_action.triggered.connect(self.close)
+        exit_action.triggered.connect(self.close, _DIRECT)
         file_menu.addAction(exit_action)
         
         # Preset menu
         preset_menu = menubar.addMenu("프리셋")
         
         new_preset_action = QAction("새 프리셋...", self)
-        new_preset_action.triggered.connect(self.create_new_preset)
+        new_preset_action.triggered.connect(self.create_new_preset, _DIRECT)
         preset_menu.addAction(new_preset_action)
         
         import_action = QAction("프리셋 가져오기...", self)
-        import_action.triggered.connect(self.import_preset)
+        import_action.triggered.connect(self.import_preset, _DIRECT)
         preset_menu.addAction(import_action)
         
         export_action = QAction("프리셋 내보내기...", self)
-        export_action.triggered.connect(self.export_preset)
+        export_action.triggered.connect(self.export_preset, _DIRECT)
         preset_menu.addAction(export_action)
         
         # Help menu
         help_menu = menubar.addMenu("도움말")
         about_action = QAction("정보", self)
-        about_action.triggered.connect(self.show_about)
+        about_action.triggered.connect(self.show_about, _DIRECT)
         help_menu.addAction(about_action)
     
     def refresh_presets(self):
         """Refresh preset combo box"""
-        self.preset_combo.clear()
-        for preset in self.preset_manager.list_presets_with_info():
-            self.preset_combo.addItem(preset["name"], preset["key"])
+        # Repopulate in one batch: no per-item signals or relayouts
+        self.preset_combo.blockSignals(True)
+        self.preset_combo.setUpdatesEnabled(False)
+        try:
+            self.preset_combo.clear()
+            for preset in self._get_presets_cached():
+                self.preset_combo.addItem(preset["name"], preset["key"])
+        finally:
+            self.preset_combo.setUpdatesEnabled(True)
+            self.preset_combo.blockSignals(False)
+        self.preset_combo.currentTextChanged.emit(self.preset_combo.currentText())
+    
+    def _get_presets_cached(self) -> list:
+        """Preset listing, rebuilt only after _invalidate_presets()"""
+        if self._presets_cache is None:
+            self._presets_cache = self.preset_manager.list_presets_with_info()
+        return self._presets_cache
+    
+    def _invalidate_presets(self):
+        self._presets_cache = None
+    
+    def init_network_worker(self):
+        """Start the persistent thread that runs blocking server calls"""
+        self._net_thread = QThread(self)
+        self.net_worker = NetworkWorker()
+        self.net_worker.moveToThread(self._net_thread)
+        
+        queued = Qt.ConnectionType.QueuedConnection
+        self.connection_test_requested.connect(self.net_worker.test_connection, queued)
+        self.models_requested.connect(self.net_worker.list_models, queued)
+        self.model_load_requested.connect(self.net_worker.ensure_model_loaded, queued)
+        self.net_worker.connection_tested.connect(self.on_connection_tested, queued)
+        self.net_worker.models_listed.connect(self.on_models_listed, queued)
+        self.net_worker.model_loaded.connect(self.on_model_loaded, queued)
+        
+        self._net_thread.start()
     
     def init_translator(self):
         """Initialize the translator"""
@@ -1128,47 +1743,6 @@ class RLMTranslatorGUIv2(QMainWindow):
             self.chunk_display.setText(str(info.get('chunk_size', 2000)))
             self.status_bar.showMessage(f"프리셋: {name}")
 
-    def save_file(self):
-        """Save translation to file with auto-incrementing filename check"""
-        if not self.target_text.toPlainText():
-            return
-            
-        initial_name = "translation_result.txt"
-        file_path, _ = QFileDialog.getSaveFileName(
-            self, "저장", initial_name, "Text Files (*.txt);;All Files (*)"
-        )
-        
-        if file_path:
-            path_obj = Path(file_path)
-            
-            # Auto-increment if file exists (Update request)
-            counter = 1
-            while path_obj.exists():
-                stem = path_obj.stem
-                import re
-                match = re.search(r'_(\d+)$', stem)
-                
-                if match:
-                   # This handles "test_1" -> "test_2"
-                   base_name = stem[:match.start()]
-                   current_num = int(match.group(1))
-                   path_obj = path_obj.with_name(f"{base_name}_{current_num + 1}{path_obj.suffix}")
-                else:
-                   path_obj = path_obj.with_name(f"{stem}_{counter}{path_obj.suffix}")
-                
-            try:
-                with open(path_obj, 'w', encoding='utf-8') as f:
-                    f.write(self.target_text.toPlainText())
-                QMessageBox.information(self, "저장됨", f"저장되었습니다: {path_obj.name}")
-            except Exception as e:
-                QMessageBox.warning(self, "오류", f"저장 실패: {e}")
-
-    def copy_result(self):
-        """Copy translation to clipboard"""
-        clipboard = QApplication.clipboard()
-        clipboard.setText(self.target_text.toPlainText())
-        self.status_bar.showMessage("클립보드에 복사됨", 2000)
-
     def view_glossary(self):
         """Open glossary viewer dialog"""
         if not self.translator:
@@ -1187,8 +1761,11 @@ class RLMTranslatorGUIv2(QMainWindow):
                 soft = state.soft_glossary
                 confirmed = state.confirmed_terms
             
-        dialog = GlossaryViewerDialog(hard, soft, confirmed, self)
-        dialog.exec()
+        if self._glossary_viewer is None:
+            self._glossary_viewer = GlossaryViewerDialog(hard, soft, confirmed, self)
+        else:
+            self._glossary_viewer.set_data(hard, soft, confirmed)
+        self._glossary_viewer.exec()
     
     def edit_preset(self):
         """Open preset editor dialog"""
@@ -1198,20 +1775,31 @@ class RLMTranslatorGUIv2(QMainWindow):
         # Create a copy for editing
         preset = TranslationPreset.from_dict(self.translator.current_preset.to_dict())
         
-        dialog = PresetEditorDialog(preset, self)
+        if self._preset_editor is None:
+            self._preset_editor = PresetEditorDialog(preset, self)
+        else:
+            self._preset_editor.set_preset(preset)
+        dialog = self._preset_editor
         if dialog.exec() == QDialog.DialogCode.Accepted:
             updated = dialog.get_updated_preset()
             key = self.preset_combo.currentData()
             self.preset_manager.save_preset(key, updated)
+            self._invalidate_presets()
             self.translator.set_preset(key)
             self.update_preset_display()
             QMessageBox.information(self, "저장됨", "프리셋이 저장되었습니다.")
     
     def edit_glossary(self):
         """Open glossary editor dialog"""
-        dialog = GlossaryEditorDialog(self.custom_glossary.copy(), self)
+        if self._glossary_editor is None:
+            self._glossary_editor = GlossaryEditorDialog(self.custom_glossary.copy(), self)
+        else:
+            # Cancelled edits from the last session must not survive
+            self._glossary_editor.set_glossary(self.custom_glossary.copy())
+        dialog = self._glossary_editor
         if dialog.exec() == QDialog.DialogCode.Accepted:
             self.custom_glossary = dialog.get_glossary()
+            self._glossary_matcher = GlossaryMatcher(self.custom_glossary) if self.custom_glossary else None
             term_count = len(self.custom_glossary)
             if term_count > 0:
                 self.glossary_btn.setText(f"📖 용어집 ({term_count})")
@@ -1225,23 +1813,21 @@ class RLMTranslatorGUIv2(QMainWindow):
         if not self.translator:
             return
         
-        from PyQt6.QtWidgets import QInputDialog
-        
         name, ok = QInputDialog.getText(self, "프리셋 저장", "새 프리셋 이름:")
         if ok and name:
             key = name.lower().replace(" ", "_")
             self.translator.save_current_preset_as(key, name)
+            self._invalidate_presets()
             self.refresh_presets()
             QMessageBox.information(self, "저장됨", f"'{name}' 프리셋이 저장되었습니다.")
     
     def create_new_preset(self):
         """Create new preset from scratch"""
-        from PyQt6.QtWidgets import QInputDialog
-        
         name, ok = QInputDialog.getText(self, "새 프리셋", "프리셋 이름:")
         if ok and name:
             key = name.lower().replace(" ", "_")
             self.preset_manager.create_custom_preset(key, name, base_preset="general")
+            self._invalidate_presets()
             self.refresh_presets()
             
             # Select the new preset
@@ -1257,6 +1843,7 @@ class RLMTranslatorGUIv2(QMainWindow):
         if file_path:
             preset = self.preset_manager.import_preset(Path(file_path))
             if preset:
+                self._invalidate_presets()
                 self.refresh_presets()
                 QMessageBox.information(self, "가져오기 완료", f"'{preset.name}' 프리셋을 가져왔습니다.")
     
@@ -1283,7 +1870,6 @@ class RLMTranslatorGUIv2(QMainWindow):
         try:
             if self.use_rlm_mode:
                 # Use RLM mode with RootOrchestrator
-                from rlm_state import PresetType
                 preset_key = self.preset_combo.currentData() or "general"
                 preset_type = self._get_preset_type(preset_key)
                 self.root_orchestrator = RootOrchestrator(
@@ -1291,6 +1877,7 @@ class RLMTranslatorGUIv2(QMainWindow):
                     preset_type=preset_type,
                     max_retries=self.rlm_control_panel.get_max_retries()
                 )
+                self._orch_sig = None
                 self.translator = None
             else:
                 # Use non-RLM mode with RLMTranslatorV2
@@ -1304,16 +1891,33 @@ class RLMTranslatorGUIv2(QMainWindow):
             self.status_bar.showMessage(f"프로바이더 변경 실패: {e}")
     
     def refresh_models(self):
-        self.model_combo.clear()
         if self.translator:
-            try:
-                models = self.translator.list_models()
-                if models:
-                    self.model_combo.addItems(models)
-                else:
-                    self.model_combo.addItem("(모델 없음)")
-            except:
-                self.model_combo.addItem("(연결 실패)")
+            self._set_model_items(["(불러오는 중...)"])
+            self.models_requested.emit(self.translator)
+        else:
+            self._set_model_items([])
+    
+    def on_models_listed(self, translator, models):
+        if translator is not self.translator:
+            return  # provider changed while the request was in flight
+        if models is None:
+            self._set_model_items(["(연결 실패)"])
+        elif models:
+            self._set_model_items(models)
+        else:
+            self._set_model_items(["(모델 없음)"])
+    
+    def _set_model_items(self, items: list):
+        """Replace the model list with one relayout and one change signal"""
+        self.model_combo.blockSignals(True)
+        self.model_combo.setUpdatesEnabled(False)
+        try:
+            self.model_combo.clear()
+            self.model_combo.addItems(items)
+        finally:
+            self.model_combo.setUpdatesEnabled(True)
+            self.model_combo.blockSignals(False)
+        self.model_combo.currentTextChanged.emit(self.model_combo.currentText())
     
     def on_model_changed(self, model_name: str):
         """Handle model selection change - load model in LM Studio if needed"""
@@ -1327,34 +1931,49 @@ class RLMTranslatorGUIv2(QMainWindow):
         if not self.translator:
             return
         
-        try:
-            # Check if we have llm_client with ensure_model_loaded
-            if hasattr(self.translator, 'llm_client'):
-                llm_client = self.translator.llm_client
-                if hasattr(llm_client, 'ensure_model_loaded'):
-                    self.status_bar.showMessage(f"모델 로드 중: {model_name}...")
-                    QApplication.processEvents()  # Update UI
-                    
-                    if llm_client.ensure_model_loaded(model_name):
-                        self.status_bar.showMessage(f"모델 로드됨: {model_name}")
-                    else:
-                        self.status_bar.showMessage(f"모델 로드 실패: {model_name}")
-        except Exception as e:
-            self.status_bar.showMessage(f"모델 변경 실패: {e}")
+        # Check if we have llm_client with ensure_model_loaded
+        llm_client = getattr(self.translator, 'llm_client', None)
+        if hasattr(llm_client, 'ensure_model_loaded'):
+            self.status_bar.showMessage(f"모델 로드 중: {model_name}...")
+            self.model_load_requested.emit(self.translator, model_name)
+    
+    def on_model_loaded(self, translator, model_name: str, ok: bool, error: str):
+        if translator is not self.translator:
+            return
+        if error:
+            self.status_bar.showMessage(f"모델 변경 실패: {error}")
+        elif ok:
+            self.status_bar.showMessage(f"모델 로드됨: {model_name}")
+        else:
+            self.status_bar.showMessage(f"모델 로드 실패: {model_name}")
     
     def test_connection(self):
         if not self.translator:
             return
         
-        if self.translator.test_connection():
+        self.test_btn.setEnabled(False)
+        self.status_bar.showMessage("연결 테스트 중...")
+        self.connection_test_requested.emit(self.translator)
+    
+    def on_connection_tested(self, translator, ok: bool):
+        self.test_btn.setEnabled(True)
+        if translator is not self.translator:
+            return
+        if ok:
+            self.status_bar.showMessage("연결됨")
             QMessageBox.information(self, "성공", "LLM 서버에 연결되었습니다.")
             self.refresh_models()
         else:
+            self.status_bar.showMessage("연결 실패")
             QMessageBox.warning(self, "실패", "연결할 수 없습니다.")
     
     def update_char_count(self):
-        text = self.source_text.toPlainText()
-        self.char_count_label.setText(f"{len(text)}자")
+        self._char_count_timer.start()
+    
+    def _do_update_char_count(self):
+        # characterCount() includes the final paragraph separator
+        count = self.source_text.document().characterCount() - 1
+        self.char_count_label.setText(f"{count}자")
     
     def load_file(self):
         file_path, _ = QFileDialog.getOpenFileName(
@@ -1362,26 +1981,31 @@ class RLMTranslatorGUIv2(QMainWindow):
             "텍스트 파일 (*.txt *.srt *.md);;모든 파일 (*.*)"
         )
         if file_path:
-            # Try multiple encodings for Korean text files
-            encodings = ['utf-8', 'cp949', 'euc-kr', 'utf-16', 'latin-1']
-            content = None
-            used_encoding = None
+            try:
+                raw = Path(file_path).read_bytes()
+            except Exception as e:
+                QMessageBox.warning(self, "오류", f"파일 열기 실패: {e}")
+                return
             
-            for encoding in encodings:
-                try:
-                    with open(file_path, 'r', encoding=encoding) as f:
-                        content = f.read()
-                    used_encoding = encoding
-                    break
-                except (UnicodeDecodeError, UnicodeError):
-                    continue
-                except Exception as e:
-                    QMessageBox.warning(self, "오류", f"파일 열기 실패: {e}")
-                    return
+            content, used_encoding = _decode_text(raw)
             
             if content is not None:
-                self.source_text.setPlainText(content)
+                # Wrapping very large files makes every relayout expensive
+                if len(content) > _NOWRAP_THRESHOLD:
+                    self.source_text.setLineWrapMode(QPlainTextEdit.LineWrapMode.NoWrap)
+                else:
+                    self.source_text.setLineWrapMode(QPlainTextEdit.LineWrapMode.WidgetWidth)
                 self.current_file = Path(file_path)
+                self._source_load_gen += 1
+                if len(content) > _CHUNKED_LOAD_THRESHOLD:
+                    self._source_loading = True
+                    self.source_text.clear()
+                    self.source_text.setReadOnly(True)
+                    self.source_text.setUndoRedoEnabled(False)
+                    self._load_in_chunks(content, self._source_load_gen)
+                else:
+                    self._finish_source_load()
+                    self.source_text.setPlainText(content)
                 
                 # Auto-select subtitle preset for .srt files
                 if file_path.endswith('.srt'):
@@ -1393,71 +2017,108 @@ class RLMTranslatorGUIv2(QMainWindow):
             else:
                 QMessageBox.warning(self, "오류", "파일 인코딩을 인식할 수 없습니다.")
     
+    def _load_in_chunks(self, text: str, gen: int, pos: int = 0):
+        """Append one slice of a large file, then yield to the event loop.
+
+        appendPlainText always starts a new paragraph, so slices end on a
+        line break (which is dropped) rather than at a fixed offset.
+        """
+        if gen != self._source_load_gen:
+            return
+        end = text.find('\n', pos + _CHUNKED_LOAD_SLICE)
+        self.source_text.setUpdatesEnabled(False)
+        try:
+            self.source_text.appendPlainText(text[pos:] if end < 0 else text[pos:end])
+        finally:
+            self.source_text.setUpdatesEnabled(True)
+        if end < 0:
+            self._finish_source_load()
+            self.source_text.moveCursor(QTextCursor.MoveOperation.Start)
+            return
+        QTimer.singleShot(0, lambda: self._load_in_chunks(text, gen, end + 1))
+    
+    def _finish_source_load(self):
+        self._source_loading = False
+        self.source_text.setUndoRedoEnabled(True)
+        self.source_text.setReadOnly(False)
+    
     def save_file(self):
-        if not self.target_text.toPlainText():
+        """Save translation to file, suggesting a free name if the default exists"""
+        text = self.target_text.toPlainText()
+        if not text:
             return
         
         suggested = ""
         if self.current_file:
             target_lang = self._get_target_lang_code()
-            suggested = str(self.current_file.parent / f"{self.current_file.stem}_{target_lang}{self.current_file.suffix}")
-        
+            suggested_path = self.current_file.parent / f"{self.current_file.stem}_{target_lang}{self.current_file.suffix}"
+            if suggested_path.exists():
+                # Parse the stem once, then probe name_n for increasing n.
+                # This handles "test_1" -> "test_2" and "test" -> "test_1"
+                stem, suffix = suggested_path.stem, suggested_path.suffix
+                match = _TRAILING_NUM_RE.search(stem)
+                if match:
+                    base_name, n = stem[:match.start()], int(match.group(1)) + 1
+                else:
+                    base_name, n = stem, 1
+                while True:
+                    suggested_path = suggested_path.with_name(f"{base_name}_{n}{suffix}")
+                    if not suggested_path.exists():
+                        break
+                    n += 1
+            suggested = str(suggested_path)
+        
+        # An explicitly chosen path is kept as-is; the dialog already
+        # confirms overwriting an existing file
         file_path, _ = QFileDialog.getSaveFileName(self, "저장", suggested, "텍스트 파일 (*.txt);;SRT (*.srt)")
-        if file_path:
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(self.target_text.toPlainText())
-            self.status_bar.showMessage(f"저장됨: {file_path}")
+        if not file_path:
+            return
+        
+        path_obj = Path(file_path)
+        
+        try:
+            path_obj.write_bytes(text.encode('utf-8'))
+            self.status_bar.showMessage(f"저장됨: {path_obj}")
+        except OSError as e:
+            QMessageBox.warning(self, "오류", f"저장 실패: {e}")
     
     def copy_result(self):
         QApplication.clipboard().setText(self.target_text.toPlainText())
         self.status_bar.showMessage("복사됨")
     
     def _get_source_lang_code(self) -> str:
-        lang_map = {"자동 감지": "auto", "한국어": "ko", "일본어": "ja", "영어": "en"}
-        return lang_map.get(self.source_lang_combo.currentText(), "auto")
+        return _SRC_LANG_MAP.get(self.source_lang_combo.currentText(), "auto")
     
     def _get_target_lang_code(self) -> str:
-        lang_map = {"한국어": "ko", "일본어": "ja", "영어": "en"}
-        return lang_map.get(self.target_lang_combo.currentText(), "ko")
+        return _TGT_LANG_MAP.get(self.target_lang_combo.currentText(), "ko")
 
     def _get_preset_type(self, preset_key: str) -> PresetType:
         """Convert preset key string to PresetType enum."""
-        preset_map = {
-            "subtitle": PresetType.SUBTITLE,
-            "patent": PresetType.PATENT,
-            "paper": PresetType.PAPER,
-            "novel": PresetType.NOVEL,
-            "technical": PresetType.TECHNICAL,
-            "general": PresetType.GENERAL
-        }
-        return preset_map.get(preset_key, PresetType.GENERAL)
-
-    def _chunk_text(self, text: str, chunk_size: int = 1000) -> list:
-        """Split text into chunks based on selected chunking option."""
-        chunker = ChunkingStrategy(chunk_size=chunk_size)
-        
-        # Check which chunking mode is selected
-        if self.rlm_control_panel.is_paragraph_chunking():
-            # Paragraph-based chunking
-            def show_warning(msg):
-                print(f"[CHUNKING WARNING] {msg}")
-                # Could also show in status bar
-            chunks = chunker.chunk_by_paragraph(text, show_warning_callback=show_warning)
-        else:
-            # Word/character-based chunking
-            chunks = chunker.chunk_text(text)
-        
-        return [chunk[2] for chunk in chunks]
+        return _PRESET_TYPE_MAP.get(preset_key, PresetType.GENERAL)
 
     def start_translation(self):
-        text = self.source_text.toPlainText().strip()
-        if not text:
+        if self._source_loading:
+            self.status_bar.showMessage("파일을 불러오는 중입니다...")
+            return
+        # A cancelled run still owns the translator until its request returns
+        self._stale_workers = [w for w in self._stale_workers if w.isRunning()]
+        if self._stale_workers:
+            self.status_bar.showMessage("이전 번역을 취소하는 중입니다. 잠시 후 다시 시도하세요.")
+            return
+        # One snapshot of the source for the worker thread (the document
+        # itself must not be touched off the GUI thread)
+        text = self.source_text.toPlainText()
+        if not text or text.isspace():
             QMessageBox.warning(self, "오류", "텍스트를 입력해주세요.")
             return
 
         # Clear previous state
         self.target_text.clear()
+        self._next_chunk_idx = 0
+        self._pending_chunks = []
         self.rlm_progress_panel.clear()
+        self._pending_rlm_progress = self._pending_rlm_flags = self._pending_rlm_cost = None
+        self._pending_rlm_repairs = []
         self.translate_btn.setEnabled(False)
         self.cancel_btn.setVisible(True)
         self.progress_bar.setVisible(True)
@@ -1468,35 +2129,42 @@ class RLMTranslatorGUIv2(QMainWindow):
             preset_key = self.preset_combo.currentData() or "general"
             try:
                 config = LLMConfig.from_env()
-                preset_type = self._get_preset_type(preset_key)
-                self.root_orchestrator = RootOrchestrator(
-                    llm_config=config,
-                    preset_type=preset_type,
-                    max_retries=self.rlm_control_panel.get_max_retries(),
-                    source_lang=self._get_source_lang_code(),
-                    target_lang=self._get_target_lang_code(),
-                    check_sentence=self.rlm_control_panel.is_sentence_verify(),
-                    check_length=self.rlm_control_panel.is_length_verify()
-                )
-
-                # Chunk text
-                chunks = self._chunk_text(text)
-
-                # Set text
-                self.root_orchestrator.set_text(chunks)
-                
-                # Set custom glossary if defined
-                if self.custom_glossary:
-                    self.root_orchestrator.set_glossary(self.custom_glossary)
-                    print(f"[GLOSSARY] {len(self.custom_glossary)} terms loaded")
-
-                # Create worker with RLM support
+                source_lang = self._get_source_lang_code()
+                target_lang = self._get_target_lang_code()
+                max_retries = self.rlm_control_panel.get_max_retries()
+                check_sentence = self.rlm_control_panel.is_sentence_verify()
+                check_length = self.rlm_control_panel.is_length_verify()
+                sig = (config.provider, preset_key, source_lang, target_lang,
+                       max_retries, check_sentence, check_length)
+                if self.root_orchestrator is not None and sig == self._orch_sig:
+                    # Same settings: keep the warm client, drop last run's state
+                    self.root_orchestrator.reset()
+                else:
+                    self.root_orchestrator = RootOrchestrator(
+                        llm_config=config,
+                        preset_type=self._get_preset_type(preset_key),
+                        max_retries=max_retries,
+                        source_lang=source_lang,
+                        target_lang=target_lang,
+                        check_sentence=check_sentence,
+                        check_length=check_length
+                    )
+                    self._orch_sig = sig
+
+                # Create worker with RLM support; it chunks the text and
+                # loads the glossary before translating
                 self.worker = TranslationWorker(
                     self.root_orchestrator, text,
-                    self._get_source_lang_code(),
-                    self._get_target_lang_code(),
-                    use_rlm=True
+                    source_lang, target_lang,
+                    use_rlm=True,
+                    by_paragraph=self.rlm_control_panel.is_paragraph_chunking(),
+                    glossary=self.custom_glossary,
+                    glossary_matcher=self._glossary_matcher
                 )
+                self.worker.chunking_done.connect(self.on_chunking_done)
+                self.worker.rlm_quality_flags.connect(self.on_rlm_quality_flags)
+                self.worker.rlm_cost_stats.connect(self.on_rlm_cost_stats)
+                self.worker.rlm_repair.connect(self.on_rlm_repair)
             except Exception as e:
                 QMessageBox.warning(self, "오류", f"RLM 초기화 실패: {e}")
                 self.cancel_translation()
@@ -1508,29 +2176,76 @@ class RLMTranslatorGUIv2(QMainWindow):
                 return
 
             self.translator.reset_costs()
+            self.translator.max_concurrency = self.concurrency_spin.value()
+            self.translator.use_response_cache = self.response_cache_check.isChecked()
+            model_name = self.model_combo.currentText()
+            self.translator.active_model = None if model_name.startswith("(") else model_name
             self.worker = TranslationWorker(
-                self.translator, text,
+                self.translator, text.strip(),
                 self._get_source_lang_code(),
                 self._get_target_lang_code(),
                 use_rlm=False
             )
 
-        self.worker.progress.connect(self.on_progress)
+        self.worker.chunk_done.connect(self.on_chunk_done)
         self.worker.finished.connect(self.on_finished)
         self.worker.error.connect(self.on_error)
+        self._poll_timer.start()
         self.worker.start()
     
     def cancel_translation(self):
         if self.worker and self.worker.isRunning():
-            self.worker.terminate()
-            self.worker.wait()
+            self.worker.cancel()
+            # Whatever the current request returns is no longer wanted
+            self.worker.chunk_done.disconnect()
+            if self.worker.use_rlm:
+                self.worker.rlm_quality_flags.disconnect()
+                self.worker.rlm_cost_stats.disconnect()
+                self.worker.rlm_repair.disconnect()
+            self.worker.finished.disconnect()
+            self.worker.error.disconnect()
+            if not self.worker.wait(2000):
+                # Keep a reference so the QThread isn't destroyed while running
+                self._stale_workers.append(self.worker)
+            self.worker = None
             self.on_finished(None)
     
+    def on_chunking_done(self, count: int):
+        self.rlm_progress_panel.update_step(f"Split into {count} chunks")
+    
+    def on_chunk_done(self, index: int, text: str):
+        """Append finished chunks to the result pane in source order"""
+        heapq.heappush(self._pending_chunks, (index, text))
+        if self._pending_chunks[0][0] != self._next_chunk_idx:
+            return
+        # Chunks are joined without separators, so insert at the end of
+        # the document rather than appendPlainText (which adds a block)
+        cursor = QTextCursor(self.target_text.document())
+        cursor.movePosition(QTextCursor.MoveOperation.End)
+        self.target_text.setUpdatesEnabled(False)
+        while self._pending_chunks and self._pending_chunks[0][0] == self._next_chunk_idx:
+            cursor.insertText(heapq.heappop(self._pending_chunks)[1])
+            self._next_chunk_idx += 1
+        self.target_text.setUpdatesEnabled(True)
+    
+    def _drain_queues(self):
+        """Show the worker's latest progress report, if there is a new one"""
+        if self.worker is None:
+            return
+        try:
+            message, progress = self.worker.progress_queue.popleft()
+        except IndexError:
+            return
+        self.on_progress(message, progress)
+        if self.worker.use_rlm:
+            self.on_rlm_progress(message, progress)
+    
     def on_progress(self, message: str, progress: float):
         self.progress_bar.setValue(int(progress * 100))
         self.progress_label.setText(message)
     
     def on_finished(self, result: Optional[TranslationResult]):
+        self._poll_timer.stop()
         self.translate_btn.setEnabled(True)
         self.cancel_btn.setVisible(False)
         self.progress_bar.setVisible(False)
@@ -1540,7 +2255,9 @@ class RLMTranslatorGUIv2(QMainWindow):
             return
         
         if result.success:
-            self.target_text.setPlainText(result.translated_text)
+            # Usually streamed already; re-layout only if a chunk was missed
+            if self.target_text.toPlainText() != result.translated_text:
+                self.target_text.setPlainText(result.translated_text)
             self.save_btn.setEnabled(True)
             self.copy_btn.setEnabled(True)
             
@@ -1549,16 +2266,39 @@ class RLMTranslatorGUIv2(QMainWindow):
                 f"완료 [{result.preset_used}] - {result.chunks_count}청크, {cost['total_calls']}회 호출"
             )
         else:
-            if result.translated_text:
+            if result.translated_text and self.target_text.toPlainText() != result.translated_text:
                 self.target_text.setPlainText(result.translated_text)
             QMessageBox.warning(self, "오류", f"번역 오류: {result.error_message}")
     
     def on_error(self, error: str):
+        self._poll_timer.stop()
         self.translate_btn.setEnabled(True)
         self.cancel_btn.setVisible(False)
         self.progress_bar.setVisible(False)
         QMessageBox.critical(self, "오류", f"번역 실패: {error}")
     
+    def closeEvent(self, event):
+        """Stop the network and translation threads before the window closes"""
+        self._net_thread.quit()
+        workers = self._stale_workers + ([self.worker] if self.worker else [])
+        for worker in workers:
+            worker.cancel()
+        threads = [self._net_thread] + workers
+        if not self._closing:
+            self._closing = True
+            # Give a finishing request a moment before deferring the close
+            deadline = time.monotonic() + 2.0
+            for thread in threads:
+                thread.wait(max(0, int((deadline - time.monotonic()) * 1000)))
+        if any(thread.isRunning() for thread in threads):
+            # A request may be stuck on a slow server. Threads are never
+            # terminated: hide the window and close once they have unwound
+            event.ignore()
+            self.hide()
+            QTimer.singleShot(200, self.close)
+            return
+        super().closeEvent(event)
+    
     def show_about(self):
         QMessageBox.about(
             self, "RLM-Trans v2",
@@ -1582,9 +2322,8 @@ class RLMTranslatorGUIv2(QMainWindow):
             step_name: Name of the current step (PLAN, RETRIEVE, etc.)
             progress: Progress value (0.0 to 1.0)
         """
-        self.rlm_progress_panel.update_step(step_name)
-        self.rlm_progress_panel.update_progress(progress)
-        self.progress_label.setText(step_name)
+        self._pending_rlm_progress = (step_name, progress)
+        self._schedule_rlm_flush()
 
     def on_rlm_quality_flags(self, flags: list):
         """
@@ -1593,7 +2332,8 @@ class RLMTranslatorGUIv2(QMainWindow):
         Args:
             flags: List of quality flags (FRESH, REPAIRED, FAILED)
         """
-        self.rlm_progress_panel.update_quality_flags(flags)
+        self._pending_rlm_flags = flags
+        self._schedule_rlm_flush()
 
     def on_rlm_cost_stats(self, cost: float, calls: int, chunks: int):
         """
@@ -1604,7 +2344,8 @@ class RLMTranslatorGUIv2(QMainWindow):
             calls: Total number of API calls
             chunks: Number of chunks translated
         """
-        self.rlm_progress_panel.update_cost_stats(cost, calls, chunks)
+        self._pending_rlm_cost = (cost, calls, chunks)
+        self._schedule_rlm_flush()
 
     def on_rlm_repair(self, repair_type: str, message: str):
         """
@@ -1614,7 +2355,33 @@ class RLMTranslatorGUIv2(QMainWindow):
             repair_type: Type of repair performed
             message: Repair message
         """
-        self.rlm_progress_panel.add_repair_history(repair_type, message)
+        self._pending_rlm_repairs.append((repair_type, message))
+        self._schedule_rlm_flush()
+
+    def _schedule_rlm_flush(self):
+        if not self._rlm_flush_scheduled:
+            self._rlm_flush_scheduled = True
+            QTimer.singleShot(_RLM_UPDATE_INTERVAL_MS, self._flush_rlm_updates)
+
+    def _flush_rlm_updates(self):
+        """Apply the latest pending RLM panel state in one go"""
+        self._rlm_flush_scheduled = False
+        panel = self.rlm_progress_panel
+        if self._pending_rlm_progress is not None:
+            step_name, progress = self._pending_rlm_progress
+            self._pending_rlm_progress = None
+            panel.update_step(step_name)
+            panel.update_progress(progress)
+            self.progress_label.setText(step_name)
+        if self._pending_rlm_flags is not None:
+            panel.update_quality_flags(self._pending_rlm_flags)
+            self._pending_rlm_flags = None
+        if self._pending_rlm_cost is not None:
+            panel.update_cost_stats(*self._pending_rlm_cost)
+            self._pending_rlm_cost = None
+        if self._pending_rlm_repairs:
+            panel.add_repair_history_batch(self._pending_rlm_repairs)
+            self._pending_rlm_repairs = []
 
     def on_preset_changed_in_gui(self, preset_name: str):
         """
@@ -2,10 +2,52 @@
 RLM Verifier/Critic
 Rule-based validation with optional LLM validation
 """
-from typing import Dict, Any, List, Optional
+import copy
+import hashlib
+import json
+import re
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, FrozenSet, Iterable, Iterator, List, NamedTuple, Optional, Tuple
 from enum import Enum
 
 from rlm_state import QualityFlagType, RepairType
+from context_package import GlossaryMatcher
+
+# Proper sentence ending (., !, ?, full-width forms; covers 다. / 요. / 니다.)
+# followed only by trailing whitespace
+_SENTENCE_END_RE = re.compile(r'[.!?。！？]\s*\Z')
+# Trailing "..." or "…" left by a cut-off response
+_TRUNCATION_RE = re.compile(r'(?:\.{3}|…)\s*\Z')
+# Whitespace-delimited number, e.g. a claim or reference numeral
+_NUMBER_TOKEN_RE = re.compile(r'(?<!\S)\d+(?!\S)')
+
+# Limits for one batched LLM validation request (source + translation chars)
+LLM_BATCH_MAX_CHARS = 8000
+LLM_BATCH_MAX_ITEMS = 20
+
+# Size of the Verifier result cache; bump the version when check rules change
+VALIDATION_CACHE_SIZE = 1024
+_VALIDATION_CACHE_VERSION = 1
+# Matchers kept by the Verifier per cache (one per distinct term/word list)
+_MATCHER_CACHE_SIZE = 64
+
+LLM_BATCH_PROMPT = """Validate these translations for meaning preservation, naturalness and tone.
+Return ONLY a JSON array aligned by index, one object per item:
+[{"index": 1, "valid": true, "issues": ["..."]}, ...]
+
+"""
+
+
+def _strip_bounds(text: str) -> Tuple[int, int]:
+    """(start, end) of text.strip() inside text, without copying the string"""
+    start, end = 0, len(text)
+    while end > start and text[end - 1].isspace():
+        end -= 1
+    while start < end and text[start].isspace():
+        start += 1
+    return start, end
 
 
 class ValidationType(str, Enum):
@@ -24,33 +66,37 @@ class ErrorSeverity(str, Enum):
     SOFT = "soft"  # Should fix - quality issue
 
 
+# Plain value for the hot comparisons; ErrorSeverity members compare equal
+_HARD = ErrorSeverity.HARD.value
+
+
+class ErrorRecord(NamedTuple):
+    """One validation error"""
+    type: str
+    message: str
+    severity: str
+
+
 class ValidationResult:
     """Result of validation"""
 
+    __slots__ = ("valid", "errors", "warnings", "repair_type", "repair_description")
+
     def __init__(self, valid: bool = True):
         self.valid = valid
-        self.errors: List[Dict[str, Any]] = []
+        self.errors: List[ErrorRecord] = []
         self.warnings: List[Dict[str, Any]] = []
         self.repair_type: Optional[RepairType] = None
         self.repair_description: Optional[str] = None
 
-    def add_error(self, error_type, message: str, severity: ErrorSeverity = ErrorSeverity.HARD):
-        """Add an error"""
-        # Handle enum types
-        if hasattr(error_type, 'value'):
-            error_type = error_type.value
-        self.errors.append({
-            "type": error_type,
-            "message": message,
-            "severity": severity.value
-        })
+    def add_error(self, error_type: str, message: str, severity: ErrorSeverity = ErrorSeverity.HARD):
+        """Add an error (ValidationType members are str and stored as-is)"""
+        # str-based enum members, equal to their plain values
+        self.errors.append(ErrorRecord(error_type, message, severity))
         self.valid = False
 
-    def add_warning(self, warning_type, message: str):
-        """Add a warning"""
-        # Handle enum types
-        if hasattr(warning_type, 'value'):
-            warning_type = warning_type.value
+    def add_warning(self, warning_type: str, message: str):
+        """Add a warning (ValidationType members are str and stored as-is)"""
         self.warnings.append({
             "type": warning_type,
             "message": message
@@ -63,11 +109,11 @@ class ValidationResult:
 
     def is_hard_error(self) -> bool:
         """Check if any hard errors exist"""
-        return any(e["severity"] == ErrorSeverity.HARD.value for e in self.errors)
+        return any(e.severity == _HARD for e in self.errors)
 
-    def get_hard_error_types(self) -> List[str]:
-        """Get list of hard error types"""
-        return [e["type"] for e in self.errors if e["severity"] == ErrorSeverity.HARD.value]
+    def get_hard_error_types(self) -> FrozenSet[str]:
+        """Get set of hard error types (ValidationType members or their values)"""
+        return frozenset(e.type for e in self.errors if e.severity == _HARD)
 
     def summary(self) -> str:
         """Get validation summary"""
@@ -92,14 +138,24 @@ class Verifier:
     Performs rule-based validation and optional LLM validation.
     """
 
-    def __init__(self, enable_llm_validation: bool = False):
+    def __init__(self, enable_llm_validation: bool = False, llm_client=None):
         """
         Initialize verifier.
 
         Args:
             enable_llm_validation: Whether to enable LLM validation
+            llm_client: LLMClient used for batched LLM validation (optional)
         """
         self.enable_llm_validation = enable_llm_validation
+        self.llm_client = llm_client
+        # forbidden word list -> GlossaryMatcher over it
+        self._forbidden_cache: Dict[tuple, GlossaryMatcher] = {}
+        # checked glossary terms -> GlossaryMatcher over them
+        self._matcher_cache: Dict[tuple, GlossaryMatcher] = {}
+        # Guards both matcher caches; validate_many runs checks concurrently
+        self._matcher_lock = threading.Lock()
+        # LRU of validate() results, see _cache_key
+        self._cache: "OrderedDict[tuple, ValidationResult]" = OrderedDict()
 
     def validate(
         self,
@@ -124,11 +180,21 @@ class Verifier:
         Returns:
             ValidationResult with validation results and recommendations
         """
+        key = self._cache_key(
+            translation, original_chunk, context, preset_type, check_sentence, check_length
+        )
+        cached = self._cache.get(key)
+        if cached is not None:
+            self._cache.move_to_end(key)
+            return self._copy_result(cached)
+
         result = ValidationResult()
+        # Lowercased once for all case-insensitive checks
+        translation_lower = translation.lower()
 
         # Perform rule-based validation
         self._rule_based_validation(
-            result, translation, original_chunk, context, preset_type,
+            result, translation, translation_lower, original_chunk, context, preset_type,
             check_sentence=check_sentence, check_length=check_length
         )
 
@@ -140,12 +206,154 @@ class Verifier:
         if not result.valid:
             self._determine_repair(result)
 
-        return result
+        self._cache[key] = result
+        if len(self._cache) > VALIDATION_CACHE_SIZE:
+            self._cache.popitem(last=False)
+        return self._copy_result(result)
+
+    def _cache_key(
+        self,
+        translation: str,
+        original_chunk: str,
+        context: Dict[str, Any],
+        preset_type: str,
+        check_sentence: bool,
+        check_length: bool
+    ) -> tuple:
+        """Key covering every input the rule-based checks look at"""
+        forbidden = context.get("style", {}).get("forbidden_words", [])
+        glossary = context.get("glossary", {})
+        return (
+            _VALIDATION_CACHE_VERSION,
+            hashlib.blake2b(translation.encode("utf-8"), digest_size=16).digest(),
+            hashlib.blake2b(original_chunk.encode("utf-8"), digest_size=16).digest(),
+            preset_type,
+            check_sentence,
+            check_length,
+            tuple(sorted(forbidden)),
+            tuple(list(glossary)[:10]),
+            bool(context.get("collect_all_errors")),
+            self.enable_llm_validation,
+        )
+
+    @staticmethod
+    def _copy_result(result: ValidationResult) -> ValidationResult:
+        """Copy with its own error/warning lists so callers can't alter the cache"""
+        clone = copy.copy(result)
+        clone.errors = list(result.errors)
+        clone.warnings = list(result.warnings)
+        return clone
+
+    def validate_batch(
+        self,
+        items: List[Tuple[str, str, Dict[str, Any]]],
+        preset_type: str = "general",
+        check_sentence: bool = True,
+        check_length: bool = True
+    ) -> List[ValidationResult]:
+        """
+        Validate several chunks, sharing LLM validation requests.
+
+        Unused API for now: RootOrchestrator validates one chunk per round
+        with validate() (LLM validation is off there by default), so the
+        batched LLM path only runs for callers that hold several chunks.
+
+        Args:
+            items: (translation, original_chunk, context) per chunk
+            preset_type: Document type preset
+            check_sentence: Whether to check sentence completion
+            check_length: Whether to check translation length
+
+        Returns:
+            ValidationResult per item, in the same order
+        """
+        results = []
+        for translation, original_chunk, context in items:
+            result = ValidationResult()
+            self._rule_based_validation(
+                result, translation, translation.lower(), original_chunk, context, preset_type,
+                check_sentence=check_sentence, check_length=check_length
+            )
+            results.append(result)
+
+        # Same condition as validate(): only failed chunks get LLM checks
+        if self.enable_llm_validation:
+            pending = [i for i, result in enumerate(results) if not result.valid]
+            if pending:
+                self._llm_validation_batch(results, items, pending, preset_type)
+
+        for result in results:
+            if not result.valid:
+                self._determine_repair(result)
+
+        return results
+
+    def validate_many(
+        self,
+        items: List[Tuple[str, str, Dict[str, Any]]],
+        preset_type: str = "general",
+        check_sentence: bool = True,
+        check_length: bool = True,
+        max_workers: int = 8
+    ) -> List[ValidationResult]:
+        """
+        Like validate_batch, but on a thread pool: rule-based checks run
+        concurrently, and each LLM batch is sent as soon as the items it
+        holds have been checked, overlapping the requests with the
+        remaining rule-based work.
+
+        API for callers that validate many finished chunks at once; the
+        RootOrchestrator pipeline does not use it, since each round's
+        repair depends on that chunk's own validate() result.
+
+        Returns:
+            ValidationResult per item, in the same order
+        """
+        results = [ValidationResult() for _ in items]
+        if not items:
+            return results
+
+        # Separate pools so LLM requests don't queue behind the rule checks
+        with ThreadPoolExecutor(max_workers=max_workers) as rule_pool, \
+                ThreadPoolExecutor(max_workers=max_workers) as llm_pool:
+            rule_futures = [
+                rule_pool.submit(
+                    self._rule_based_validation,
+                    results[i], translation, translation.lower(), original_chunk, context,
+                    preset_type, check_sentence=check_sentence, check_length=check_length
+                )
+                for i, (translation, original_chunk, context) in enumerate(items)
+            ]
+
+            def failed_items():
+                # In item order, so batches match validate_batch
+                for i, future in enumerate(rule_futures):
+                    future.result()
+                    if not results[i].valid:
+                        yield i
+
+            llm_futures = []
+            if self.enable_llm_validation:
+                for batch in self._iter_llm_batches(items, failed_items()):
+                    llm_futures.append(
+                        llm_pool.submit(self._run_llm_batch, results, items, batch, preset_type)
+                    )
+
+            # Re-raise anything a worker raised
+            for future in rule_futures + llm_futures:
+                future.result()
+
+        for result in results:
+            if not result.valid:
+                self._determine_repair(result)
+
+        return results
 
     def _rule_based_validation(
         self,
         result: ValidationResult,
         translation: str,
+        translation_lower: str,
         original_chunk: str,
         context: Dict[str, Any],
         preset_type: str,
@@ -154,8 +362,14 @@ class Verifier:
     ):
         """Perform rule-based validation"""
 
+        # Whitespace-trimmed extents, measured once without strip() copies
+        trans_start, trans_end = _strip_bounds(translation)
+        orig_start, orig_end = _strip_bounds(original_chunk)
+        trans_len = trans_end - trans_start
+        orig_len = orig_end - orig_start
+
         # Check for empty translation
-        if not translation or translation.strip() == "":
+        if trans_start == trans_end:
             result.add_error(
                 ValidationType.COMPLETION,
                 "Translation is empty",
@@ -164,7 +378,7 @@ class Verifier:
             return
 
         # Check for truncation - ends with "..."
-        if translation.rstrip().endswith("...") or translation.rstrip().endswith("…"):
+        if _TRUNCATION_RE.search(translation):
             result.add_error(
                 ValidationType.COMPLETION,
                 "Translation appears truncated (ends with '...')",
@@ -174,13 +388,7 @@ class Verifier:
         # Check for sentence completion (문장 단위 검토)
         if check_sentence:
             # Check if translation ends with proper sentence-ending punctuation
-            sentence_endings = ('.', '!', '?', '。', '！', '？', '다.', '요.', '니다.')
-            trans_stripped = translation.rstrip()
-            
-            # Check if any sentence ending matches
-            ends_with_sentence = any(trans_stripped.endswith(ending) for ending in sentence_endings)
-            
-            if not ends_with_sentence and len(trans_stripped) > 50:
+            if not _SENTENCE_END_RE.search(translation) and trans_end > 50:
                 result.add_error(
                     ValidationType.COMPLETION,
                     "Translation does not end with complete sentence",
@@ -189,9 +397,6 @@ class Verifier:
         
         # Check for length (길이 검토)
         if check_length:
-            orig_len = len(original_chunk.strip())
-            trans_len = len(translation.strip())
-            
             # Translation should be at least 50% of original length
             if orig_len > 100 and trans_len < orig_len * 0.5:
                 result.add_error(
@@ -200,45 +405,53 @@ class Verifier:
                     ErrorSeverity.HARD
                 )
 
+        # A completion error already means a repair. Unless the caller asked
+        # for every error, only the forbidden check (which outranks it when
+        # picking the repair) still matters; the rest would add warnings only
+        if result.is_hard_error() and not context.get("collect_all_errors"):
+            self._check_forbidden_content(result, translation_lower, context)
+            return
+
         # Check format-specific rules based on preset
         if preset_type == "subtitle":
             self._validate_subtitle_format(result, translation, context)
         elif preset_type == "patent":
-            self._validate_patent_format(result, translation, context)
+            self._validate_patent_format(result, translation, translation_lower, context)
         elif preset_type == "paper":
             self._validate_paper_format(result, translation, context)
 
         # Check for forbidden words/phrases
-        self._check_forbidden_content(result, translation, context)
+        self._check_forbidden_content(result, translation_lower, context)
 
         # Check length constraints
-        self._check_length_constraints(result, translation, original_chunk)
+        self._check_length_constraints(result, trans_len, orig_len)
 
         # Check terminology consistency
-        self._check_terminology(result, translation, context)
+        self._check_terminology(result, translation_lower, context)
 
     def _validate_subtitle_format(self, result: ValidationResult, translation: str, context: Dict[str, Any]):
         """Validate subtitle-specific format rules"""
-        # Check for empty lines (shouldn't happen in proper subtitle format)
-        lines = translation.strip().split('\n')
-        if len(lines) == 0:
+        # Blank subtitle text has no lines (split() always returns at least
+        # one element, so test the text itself without copying it)
+        if not translation or translation.isspace():
             result.add_error(
                 ValidationType.FORMAT,
                 "Subtitle has no lines",
                 ErrorSeverity.HARD
             )
 
-    def _validate_patent_format(self, result: ValidationResult, translation: str, context: Dict[str, Any]):
+    def _validate_patent_format(self, result: ValidationResult, translation: str,
+                                translation_lower: str, context: Dict[str, Any]):
         """Validate patent-specific format rules"""
         # Check for missing claim numbers
-        if not any(word.isdigit() for word in translation.split()):
+        if not _NUMBER_TOKEN_RE.search(translation):
             result.add_warning(
                 ValidationType.STRUCTURE,
                 "No claim numbers found (typical in patent translations)"
             )
 
         # Check for proper clause markers
-        if "wherein" not in translation.lower():
+        if "wherein" not in translation_lower:
             result.add_warning(
                 ValidationType.STRUCTURE,
                 "Missing 'wherein' clause marker (optional)"
@@ -253,22 +466,40 @@ class Verifier:
                 "Paper may lack sufficient sentence structure"
             )
 
-    def _check_forbidden_content(self, result: ValidationResult, translation: str, context: Dict[str, Any]):
+    def _check_forbidden_content(self, result: ValidationResult, translation_lower: str, context: Dict[str, Any]):
         """Check for forbidden words or phrases"""
         forbidden_words = context.get("style", {}).get("forbidden_words", [])
+        if not forbidden_words:
+            return
+
+        matcher = self._get_matcher(self._forbidden_cache, tuple(forbidden_words))
 
+        # One pass over the text finds every listed word, including ones that
+        # only occur inside or overlapping a longer listed word
+        found = matcher.find_lowered(translation_lower)
         for word in forbidden_words:
-            if word.lower() in translation.lower():
+            if word in found:
                 result.add_error(
                     ValidationType.FORBIDDEN,
                     f"Contains forbidden word: '{word}'",
                     ErrorSeverity.HARD
                 )
 
-    def _check_length_constraints(self, result: ValidationResult, translation: str, original: str):
-        """Check if translation length is reasonable"""
-        orig_len = len(original)
-        trans_len = len(translation)
+    def _get_matcher(self, cache: Dict[tuple, GlossaryMatcher], terms: tuple) -> GlossaryMatcher:
+        """Cached GlossaryMatcher over terms, safe to call from several threads"""
+        with self._matcher_lock:
+            matcher = cache.get(terms)
+        if matcher is not None:
+            return matcher
+        # Built outside the lock; a concurrent duplicate build is harmless
+        matcher = GlossaryMatcher(terms)
+        with self._matcher_lock:
+            if len(cache) >= _MATCHER_CACHE_SIZE:
+                cache.pop(next(iter(cache)))
+            return cache.setdefault(terms, matcher)
+
+    def _check_length_constraints(self, result: ValidationResult, trans_len: int, orig_len: int):
+        """Check if translation length is reasonable (whitespace-trimmed lengths)"""
 
         # Avoid extreme length changes (> 3x)
         if trans_len > orig_len * 3:
@@ -285,20 +516,23 @@ class Verifier:
                 ErrorSeverity.HARD
             )
 
-    def _check_terminology(self, result: ValidationResult, translation: str, context: Dict[str, Any]):
+    def _check_terminology(self, result: ValidationResult, translation_lower: str, context: Dict[str, Any]):
         """Check terminology consistency"""
         glossary = context.get("glossary", {})
 
         if glossary:
             # Check if glossary terms are used consistently
-            glossary_sources = list(glossary.keys())
-
             # This is a simple check - would need more sophisticated analysis in real implementation
-            for term in glossary_sources[:10]:  # Check first 10 terms
-                term_lower = term.lower()
-                count = translation.lower().count(term_lower)
+            terms = tuple(term for term in list(glossary)[:10] if term)  # Check first 10 terms
+
+            # Matchers are keyed by the live term list (the orchestrator builds a
+            # fresh context per call, and an edited glossary gets a new matcher)
+            matcher = self._get_matcher(self._matcher_cache, terms)
 
-                if count == 0:
+            # One pass over the already-lowercased text finds every present term
+            found = matcher.find_lowered(translation_lower)
+            for term in terms:
+                if term not in found:
                     result.add_warning(
                         ValidationType.TERMINOLOGY,
                         f"Glossary term '{term}' not found in translation"
@@ -327,25 +561,119 @@ class Verifier:
                 "No specific quality issues detected, but could benefit from LLM validation"
             )
 
+    def _llm_validation_batch(
+        self,
+        results: List[ValidationResult],
+        items: List[Tuple[str, str, Dict[str, Any]]],
+        pending: List[int],
+        preset_type: str
+    ):
+        """Run LLM validation for the pending items, several per request"""
+        for batch in self._iter_llm_batches(items, pending):
+            self._run_llm_batch(results, items, batch, preset_type)
+
+    @staticmethod
+    def _iter_llm_batches(
+        items: List[Tuple[str, str, Dict[str, Any]]],
+        pending: Iterable[int]
+    ) -> Iterator[List[int]]:
+        """Group item indexes into batches within the LLM request limits"""
+        batch: List[int] = []
+        batch_chars = 0
+        for i in pending:
+            translation, original_chunk, _ = items[i]
+            size = len(translation) + len(original_chunk)
+            if batch and (batch_chars + size > LLM_BATCH_MAX_CHARS
+                          or len(batch) >= LLM_BATCH_MAX_ITEMS):
+                yield batch
+                batch, batch_chars = [], 0
+            batch.append(i)
+            batch_chars += size
+        if batch:
+            yield batch
+
+    def _run_llm_batch(
+        self,
+        results: List[ValidationResult],
+        items: List[Tuple[str, str, Dict[str, Any]]],
+        batch: List[int],
+        preset_type: str
+    ):
+        """Send one validation request for a batch and apply the answers"""
+        verdicts = None
+        if self.llm_client is not None:
+            prompt = LLM_BATCH_PROMPT + "\n".join(
+                f"[{n}] SRC: {items[i][1]}\nTGT: {items[i][0]}"
+                for n, i in enumerate(batch, 1)
+            )
+            try:
+                response = self.llm_client.complete(
+                    [{"role": "user", "content": prompt}], is_sub_call=True
+                )
+                verdicts = self._parse_llm_batch(response.content)
+            except Exception as e:
+                print(f"[VERIFIER] Batched LLM validation failed: {e}")
+
+        if verdicts is None:
+            # No client or unusable answer: fall back to per-item validation
+            for i in batch:
+                translation, original_chunk, context = items[i]
+                self._llm_validation(results[i], translation, original_chunk, context, preset_type)
+            return
+
+        for n, i in enumerate(batch, 1):
+            verdict = verdicts.get(n)
+            if verdict is None:
+                continue
+            for issue in verdict.get("issues") or []:
+                results[i].add_warning(ValidationType.TONE, str(issue))
+            if verdict.get("valid") is False:
+                results[i].add_error(
+                    ValidationType.TONE,
+                    "LLM validation flagged quality issues",
+                    ErrorSeverity.SOFT
+                )
+
+    @staticmethod
+    def _parse_llm_batch(content: str) -> Optional[Dict[int, Dict[str, Any]]]:
+        """Parse the JSON array answer into {index: verdict}, or None"""
+        match = re.search(r"\[.*\]", content, re.DOTALL)
+        if not match:
+            return None
+        try:
+            data = json.loads(match.group(0))
+        except json.JSONDecodeError:
+            return None
+        if not isinstance(data, list):
+            return None
+        verdicts = {}
+        for n, entry in enumerate(data, 1):
+            if isinstance(entry, dict):
+                index = entry.get("index", n)
+                if isinstance(index, int):
+                    verdicts[index] = entry
+        return verdicts
+
     def _determine_repair(self, result: ValidationResult):
         """Determine appropriate repair action based on errors"""
+        # One pass over the errors; lookups below are set membership
         hard_errors = result.get_hard_error_types()
 
         if not hard_errors:
             return
 
         # Prioritize repairs based on error type
-        if "forbidden" in hard_errors:
+        if ValidationType.FORBIDDEN in hard_errors:
             result.set_repair(
                 RepairType.TEMPLATE_REINFORCE,
                 "Remove forbidden content and re-translate"
             )
-        elif "format" in hard_errors:
+        elif ValidationType.FORMAT in hard_errors:
             result.set_repair(
                 RepairType.TEMPLATE_REINFORCE,
                 "Fix formatting errors and re-translate"
             )
-        elif "completion" in hard_errors:
+        elif ValidationType.COMPLETION in hard_errors:
             result.set_repair(
                 RepairType.RE_TRANSLATE,
                 "Re-translate the chunk completely"